@@ -0,0 +1,111 @@
+"""Array kernels for arm scoring and budget clamping.
+
+All functions operate on parallel float64 arrays (one element per arm) so
+the fallback allocator can score a whole request without per-arm Python
+dispatch.
+"""
+from enum import IntEnum
+from typing import Optional, Union
+
+import numpy as np
+
+
+class InventoryStatusCode(IntEnum):
+    """Integer codes for ArmState.inventory_status."""
+    OK = 0
+    LOW = 1
+    OUT = 2
+
+
+class GoalCode(IntEnum):
+    """Integer codes for BudgetAllocationRequest.optimization_goal."""
+    ROAS = 0
+    PROFIT = 1
+    LTV = 2
+    CPA = 3
+
+
+INVENTORY_CODES = {
+    "low_stock": InventoryStatusCode.LOW,
+    "out_of_stock": InventoryStatusCode.OUT,
+}
+
+GOAL_CODES = {
+    "roas": GoalCode.ROAS,
+    "profit": GoalCode.PROFIT,
+    "ltv": GoalCode.LTV,
+    "cpa": GoalCode.CPA,
+}
+
+# Score multiplier indexed by InventoryStatusCode
+_INVENTORY_FACTORS = np.array([1.0, 0.7, 0.1], dtype=np.float64)
+
+
+def inventory_code(status: Optional[str]) -> InventoryStatusCode:
+    """Map an inventory status string to its code (unknown/None = OK)."""
+    return INVENTORY_CODES.get(status, InventoryStatusCode.OK)
+
+
+def goal_code(goal: Union[str, GoalCode]) -> GoalCode:
+    """Map an optimization goal string to its code (unknown = ROAS)."""
+    if isinstance(goal, GoalCode):
+        return goal
+    return GOAL_CODES.get(goal, GoalCode.ROAS)
+
+
+def score_ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """Elementwise ratio that is 0 where the denominator is not positive."""
+    valid = denominator > 0
+    return np.where(valid, numerator / np.where(valid, denominator, 1.0), 0.0)
+
+
+def score_inverse(values: np.ndarray) -> np.ndarray:
+    """Elementwise 1/x for positive finite x, otherwise 0 (lower is better)."""
+    valid = (values > 0) & np.isfinite(values)
+    return np.where(valid, 1.0 / np.where(valid, values, 1.0), 0.0)
+
+
+def apply_modifiers(
+    scores: np.ndarray,
+    status_codes: np.ndarray,
+    quality: np.ndarray
+) -> np.ndarray:
+    """Apply inventory penalties and audience quality boost to base scores."""
+    return scores * _INVENTORY_FACTORS[status_codes] * (0.5 + quality)
+
+
+def apply_exploration(
+    scores: np.ndarray,
+    conversions: np.ndarray,
+    impressions: np.ndarray,
+    min_conversions: int
+) -> np.ndarray:
+    """Replace scores of low-data arms with a fixed exploration bonus."""
+    scores = np.where(
+        conversions < min_conversions,
+        np.where(impressions > 0, 1.5, 1.0),
+        scores
+    )
+    return np.maximum(scores, 0.0)
+
+
+def clamp_budgets(
+    new_budgets: np.ndarray,
+    current_budgets: np.ndarray,
+    max_change_ratio: float
+) -> np.ndarray:
+    """Clamp new budgets to within max_change_ratio of current budgets."""
+    max_change = current_budgets * max_change_ratio
+    return np.clip(
+        new_budgets,
+        np.maximum(current_budgets - max_change, 0.0),
+        current_budgets + max_change
+    )
+
+
+def change_percentages(
+    new_budgets: np.ndarray,
+    current_budgets: np.ndarray
+) -> np.ndarray:
+    """Percentage change from current budgets (0 where current is 0)."""
+    return score_ratio(new_budgets - current_budgets, current_budgets) * 100
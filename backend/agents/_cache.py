@@ -0,0 +1,64 @@
+"""In-process response cache for idempotent agent operations."""
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+import asyncio
+import functools
+import hashlib
+import time
+
+from pydantic import BaseModel
+
+
+def cached_async(
+    maxsize: int = 1024,
+    ttl_seconds: Optional[float] = None,
+    max_entry_bytes: Optional[int] = None
+):
+    """Cache an async ``(self, request) -> response`` method by request content.
+
+    Entries are keyed by a blake2b digest of the serialized request and
+    evicted least-recently-used beyond ``maxsize`` or after ``ttl_seconds``.
+    Responses larger than ``max_entry_bytes`` when serialized are not cached.
+    Concurrent misses for the same request share one call to the wrapped
+    method.
+    """
+    def decorator(func):
+        cache: "OrderedDict[bytes, Tuple[float, Any]]" = OrderedDict()
+        inflight: Dict[bytes, asyncio.Future] = {}
+        
+        @functools.wraps(func)
+        async def wrapper(self, request: BaseModel):
+            key = hashlib.blake2b(
+                request.model_dump_json().encode(), digest_size=16
+            ).digest()
+            now = time.monotonic()
+            entry = cache.get(key)
+            if entry is not None:
+                expires_at, response = entry
+                if expires_at > now:
+                    cache.move_to_end(key)
+                    return response
+                del cache[key]
+            
+            task = inflight.get(key)
+            if task is None:
+                task = asyncio.ensure_future(func(self, request))
+                inflight[key] = task
+                task.add_done_callback(lambda _: inflight.pop(key, None))
+            else:
+                # Another caller is already filling this key
+                return await asyncio.shield(task)
+            response = await asyncio.shield(task)
+            
+            if max_entry_bytes is not None:
+                if len(response.model_dump_json().encode()) > max_entry_bytes:
+                    return response
+            expires_at = now + ttl_seconds if ttl_seconds is not None else float("inf")
+            cache[key] = (expires_at, response)
+            if len(cache) > maxsize:
+                cache.popitem(last=False)
+            return response
+        
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
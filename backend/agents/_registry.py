@@ -0,0 +1,17 @@
+"""Process-wide registry of BaseAgent instances keyed by agent type."""
+from typing import Dict
+
+from backend.agents.base_agent import BaseAgent
+
+_AGENTS: Dict[str, BaseAgent] = {}
+
+
+def get_or_create(agent_type: str, **kwargs) -> BaseAgent:
+    """Return the shared BaseAgent for agent_type, creating it on first use.
+
+    Keyword arguments are passed to BaseAgent and only used on creation.
+    """
+    agent = _AGENTS.get(agent_type)
+    if agent is None:
+        agent = _AGENTS[agent_type] = BaseAgent(agent_type=agent_type, **kwargs)
+    return agent
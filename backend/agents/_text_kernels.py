@@ -0,0 +1,48 @@
+"""Byte-array kernels for measuring generated text.
+
+Text is scanned as a UTF-8 ``uint8`` array so word, sentence and syllable
+boundaries are found with vectorized comparisons instead of Python loops.
+"""
+import numpy as np
+
+# Lookup tables indexed by byte value
+_VOWELS = np.zeros(256, dtype=bool)
+_VOWELS[list(b"aeiouyAEIOUY")] = True
+_SENTENCE_END = np.zeros(256, dtype=bool)
+_SENTENCE_END[list(b".!?")] = True
+
+
+def text_buffer(text: str) -> np.ndarray:
+    """View text as a UTF-8 byte array."""
+    return np.frombuffer(text.encode("utf-8"), dtype=np.uint8)
+
+
+def _run_starts(mask: np.ndarray) -> np.ndarray:
+    """Mark the first element of every run of True values."""
+    starts = mask.copy()
+    starts[1:] &= ~mask[:-1]
+    return starts
+
+
+def count_words(buf: np.ndarray) -> int:
+    """Count whitespace-delimited words (bytes <= 0x20 separate words)."""
+    return int(np.count_nonzero(_run_starts(buf > 0x20)))
+
+
+def flesch_reading_ease(buf: np.ndarray) -> float:
+    """Flesch reading ease score (higher is easier to read).
+
+    Syllables are approximated as vowel groups per word, at least one each.
+    """
+    word_starts = _run_starts(buf > 0x20)
+    words = int(np.count_nonzero(word_starts))
+    if words == 0:
+        return 0.0
+    sentences = max(int(np.count_nonzero(_run_starts(_SENTENCE_END[buf]))), 1)
+    
+    # Assign each vowel group to the word it falls in
+    word_ids = np.cumsum(word_starts) - 1
+    per_word = np.bincount(word_ids[_run_starts(_VOWELS[buf])], minlength=words)
+    syllables = int(np.maximum(per_word, 1).sum())
+    
+    return 206.835 - 1.015 * (words / sentences) - 84.6 * (syllables / words)
@@ -1,9 +1,12 @@
 """Ad Optimization Agent for cross-channel budget allocation and optimization."""
-from typing import List, Optional, Dict, Any, Literal
-from pydantic import BaseModel, Field
+from typing import List, Optional, Dict, Any, Literal, Union
+from dataclasses import dataclass
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, TypeAdapter
 from datetime import datetime
 import logging
+import numpy as np
 
+from backend.agents import _bandit_kernels as kernels
 from backend.agents.base_agent import BaseAgent
 
 logger = logging.getLogger(__name__)
@@ -11,6 +14,8 @@ logger = logging.getLogger(__name__)
 
 class ArmState(BaseModel):
     """Arm state representing a campaign/adset with enhanced metrics."""
+    model_config = ConfigDict(frozen=True)
+    
     platform: Literal["facebook", "google"] = Field(..., description="Platform name")
     id: str = Field(..., description="Campaign or adset ID")
     campaign_id: Optional[str] = Field(default=None, description="Campaign ID")
@@ -34,17 +39,43 @@ class ArmState(BaseModel):
     days_active: Optional[int] = Field(default=None, description="Days since campaign started")
     current_daily_budget: Optional[float] = Field(default=None, description="Current daily budget")
     
+    # Derived metrics, computed once in model_post_init
+    _roas: float = PrivateAttr(default=0.0)
+    _cpa: float = PrivateAttr(default=float('inf'))
+    _profit: float = PrivateAttr(default=0.0)
+    _profit_roas: float = PrivateAttr(default=0.0)
+    _ltv_roas: float = PrivateAttr(default=0.0)
+    _inventory_code: kernels.InventoryStatusCode = PrivateAttr(
+        default=kernels.InventoryStatusCode.OK
+    )
+    
+    def model_post_init(self, __context: Any) -> None:
+        """Precompute derived metrics (fields are immutable after construction)."""
+        self._inventory_code = kernels.inventory_code(self.inventory_status)
+        spend = self.spend
+        # One spend guard and reciprocal shared by every ROAS variant
+        inv_spend = 1.0 / spend if spend > 0 else 0.0
+        self._roas = self.revenue * inv_spend
+        self._cpa = spend / self.conversions if self.conversions > 0 else float('inf')
+        # Default to 20% margin if not specified
+        margin = self.profit_margin if self.profit_margin is not None else 0.2
+        self._profit = (self.revenue * margin) - spend
+        self._profit_roas = self._profit * inv_spend
+        if self.ltv is not None and self.conversions > 0:
+            total_ltv = self.ltv * self.conversions
+            self._ltv_roas = total_ltv * inv_spend
+        else:
+            self._ltv_roas = self._roas  # Fallback to regular ROAS
+    
     @property
     def roas(self) -> float:
         """Calculate ROAS."""
-        return self.revenue / self.spend if self.spend > 0 else 0.0
+        return self._roas
     
     @property
     def cpa(self) -> float:
         """Calculate CPA."""
-        if self.conversions > 0:
-            return self.spend / self.conversions
-        return float('inf')
+        return self._cpa
     
     @property
     def ctr(self) -> float:
@@ -54,24 +85,22 @@ class ArmState(BaseModel):
     @property
     def profit(self) -> float:
         """Calculate profit (revenue * margin - spend)."""
-        if self.profit_margin is not None:
-            return (self.revenue * self.profit_margin) - self.spend
-        # Default to 20% margin if not specified
-        return (self.revenue * 0.2) - self.spend
+        return self._profit
     
     @property
     def profit_roas(self) -> float:
         """Calculate profit-based ROAS."""
-        profit_val = self.profit
-        return profit_val / self.spend if self.spend > 0 else 0.0
+        return self._profit_roas
     
     @property
     def ltv_roas(self) -> float:
         """Calculate LTV-based ROAS."""
-        if self.ltv is not None and self.conversions > 0:
-            total_ltv = self.ltv * self.conversions
-            return total_ltv / self.spend if self.spend > 0 else 0.0
-        return self.roas  # Fallback to regular ROAS
+        return self._ltv_roas
+    
+    @property
+    def inventory_code(self) -> kernels.InventoryStatusCode:
+        """Integer code for inventory_status."""
+        return self._inventory_code
     
     @property
     def has_sufficient_data(self) -> bool:
@@ -79,6 +108,55 @@ class ArmState(BaseModel):
         return self.conversions >= 10 and self.impressions >= 1000
 
 
+# Validates or dumps a whole list of arms in one core-schema pass
+ARM_LIST_ADAPTER = TypeAdapter(List[ArmState])
+
+
+@dataclass(slots=True)
+class ArmMetrics:
+    """Plain-slot view of an ArmState for hot scoring loops.
+    
+    Derived metrics are copied from the values ArmState precomputes, so the
+    formulas live in one place and scoring reads slots instead of properties.
+    """
+    id: str
+    platform: str
+    spend: float
+    revenue: float
+    conversions: int
+    impressions: int
+    current_budget: float
+    ltv: Optional[float]
+    profit_margin: Optional[float]
+    audience_quality_score: Optional[float]
+    inventory_code: kernels.InventoryStatusCode
+    roas: float
+    cpa: float
+    profit_roas: float
+    ltv_roas: float
+    
+    @classmethod
+    def from_state(cls, arm: ArmState) -> "ArmMetrics":
+        """Build metrics view from an ArmState."""
+        return cls(
+            id=arm.id,
+            platform=arm.platform,
+            spend=arm.spend,
+            revenue=arm.revenue,
+            conversions=arm.conversions,
+            impressions=arm.impressions,
+            current_budget=arm.current_daily_budget or arm.spend,
+            ltv=arm.ltv,
+            profit_margin=arm.profit_margin,
+            audience_quality_score=arm.audience_quality_score,
+            inventory_code=arm.inventory_code,
+            roas=arm.roas,
+            cpa=arm.cpa,
+            profit_roas=arm.profit_roas,
+            ltv_roas=arm.ltv_roas
+        )
+
+
 class BudgetAllocationRequest(BaseModel):
     """Request model for budget allocation."""
     arms: List[ArmState] = Field(..., description="List of campaign/adset states")
@@ -101,6 +179,17 @@ class BudgetAllocationRequest(BaseModel):
         default="intelligent",
         description="Optimization strategy (intelligent uses Pydantic AI, others use bandit algorithms)"
     )
+    
+    _goal_code: kernels.GoalCode = PrivateAttr(default=kernels.GoalCode.ROAS)
+    
+    def model_post_init(self, __context: Any) -> None:
+        """Normalize the optimization goal to its integer code."""
+        self._goal_code = kernels.goal_code(self.optimization_goal)
+    
+    @property
+    def goal_code(self) -> kernels.GoalCode:
+        """Integer code for optimization_goal."""
+        return self._goal_code
 
 
 class BudgetAllocation(BaseModel):
@@ -234,6 +323,14 @@ class AdOptimizationAgent:
             response_type=BudgetAllocationResponse
         )
         
+        # Goal-specific base scoring, resolved once per call instead of per branch
+        self._score_fns = {
+            kernels.GoalCode.ROAS: self._score_roas,
+            kernels.GoalCode.PROFIT: self._score_profit,
+            kernels.GoalCode.LTV: self._score_ltv,
+            kernels.GoalCode.CPA: self._score_cpa
+        }
+        
         self.cross_channel_agent = BaseAgent(
             agent_type="cross_channel_optimization",
             system_prompt="""You are a cross-channel ad optimization expert. Your task is to optimize 
@@ -258,11 +355,40 @@ class AdOptimizationAgent:
             response_type=CrossChannelOptimizationResponse
         )
     
+    def warm_up(self):
+        """Initialize all sub-agents up front (call once at app startup)."""
+        for agent in (
+            self.budget_agent,
+            self.cross_channel_agent
+        ):
+            agent.initialize()
+    
+    @staticmethod
+    def _score_roas(arm: ArmMetrics) -> float:
+        """Base score for the ROAS goal."""
+        return arm.roas
+    
+    @staticmethod
+    def _score_profit(arm: ArmMetrics) -> float:
+        """Base score for the profit goal."""
+        return arm.profit_roas if arm.profit_margin is not None else arm.roas * 0.8
+    
+    @staticmethod
+    def _score_ltv(arm: ArmMetrics) -> float:
+        """Base score for the LTV goal."""
+        return arm.ltv_roas if arm.ltv is not None else arm.roas * 1.2
+    
+    @staticmethod
+    def _score_cpa(arm: ArmMetrics) -> float:
+        """Base score for the CPA goal."""
+        # Lower CPA is better, so invert
+        return 1.0 / arm.cpa if arm.cpa > 0 and arm.cpa != float('inf') else 0.0
+    
     def score_arm(
         self,
-        arm: ArmState,
+        arm: Union[ArmState, ArmMetrics],
         min_conversions: int = 10,
-        optimization_goal: str = "roas"
+        optimization_goal: Union[str, kernels.GoalCode] = "roas"
     ) -> float:
         """Score an arm for budget allocation (fallback method)."""
         # Exploration bonus for low-data arms
@@ -270,23 +396,17 @@ class AdOptimizationAgent:
             exploration_bonus = 1.5 if arm.impressions > 0 else 1.0
             return exploration_bonus
         
+        # No spend means every goal's ratio is 0 (and 1/CPA is 0 too)
+        if arm.spend <= 0:
+            return 0.0
+        
         # Score based on optimization goal
-        if optimization_goal == "roas":
-            base_score = arm.roas
-        elif optimization_goal == "profit":
-            base_score = arm.profit_roas if arm.profit_margin is not None else arm.roas * 0.8
-        elif optimization_goal == "ltv":
-            base_score = arm.ltv_roas if arm.ltv is not None else arm.roas * 1.2
-        elif optimization_goal == "cpa":
-            # Lower CPA is better, so invert
-            base_score = 1.0 / arm.cpa if arm.cpa > 0 and arm.cpa != float('inf') else 0.0
-        else:
-            base_score = arm.roas
+        base_score = self._score_fns[kernels.goal_code(optimization_goal)](arm)
         
         # Apply modifiers
-        if arm.inventory_status == "out_of_stock":
+        if arm.inventory_code == kernels.InventoryStatusCode.OUT:
             base_score *= 0.1  # Heavily penalize out of stock
-        elif arm.inventory_status == "low_stock":
+        elif arm.inventory_code == kernels.InventoryStatusCode.LOW:
             base_score *= 0.7  # Reduce budget for low stock
         
         if arm.audience_quality_score is not None:
@@ -324,13 +444,16 @@ class AdOptimizationAgent:
             
             # Convert to BudgetAllocationResponse
             budget_allocations = []
+            total_allocated = 0.0
             for arm in request.arms:
-                new_budget = allocations.get(arm.id, 0.0)
-                current_budget = arm.current_daily_budget or arm.spend
+                new_budget = float(allocations.get(arm.id, 0.0))
+                total_allocated += new_budget
+                current_budget = float(arm.current_daily_budget or arm.spend)
                 change_pct = ((new_budget - current_budget) / current_budget * 100) if current_budget > 0 else 0.0
                 
+                # Values are computed internally, so skip re-validation
                 budget_allocations.append(
-                    BudgetAllocation(
+                    BudgetAllocation.model_construct(
                         arm_id=arm.id,
                         platform=arm.platform,
                         current_budget=current_budget,
@@ -343,7 +466,7 @@ class AdOptimizationAgent:
             
             return BudgetAllocationResponse(
                 allocations=budget_allocations,
-                total_allocated=sum(a.new_budget for a in budget_allocations),
+                total_allocated=total_allocated,
                 expected_improvement={
                     "method": request.strategy,
                     "estimated_improvement": "5-20%"
@@ -356,89 +479,127 @@ class AdOptimizationAgent:
         
         # Use intelligent Pydantic AI agent
         try:
-            self.budget_agent.initialize()
-            response = await self.budget_agent.execute(request)
-            logger.info(f"Agent allocated budget across {len(request.arms)} arms")
+            response = await self.budget_agent.submit(request)
+            logger.info("Agent allocated budget across %d arms", len(request.arms))
             return response
         except Exception as e:
-            logger.warning(f"Agent allocation failed, falling back to rule-based: {e}")
+            logger.warning("Agent allocation failed, falling back to rule-based: %s", e)
             # Fallback to rule-based allocation
             return await self._allocate_budget_fallback(request)
     
+    def _score_arms_vectorized(
+        self,
+        metrics: List[ArmMetrics],
+        min_conversions: int = 10,
+        optimization_goal: Union[str, kernels.GoalCode] = "roas"
+    ) -> np.ndarray:
+        """Score all arms in one vectorized pass (same semantics as score_arm)."""
+        conversions = np.array([m.conversions for m in metrics], dtype=np.float64)
+        impressions = np.array([m.impressions for m in metrics], dtype=np.float64)
+        roas = np.array([m.roas for m in metrics], dtype=np.float64)
+        
+        # Score based on optimization goal (goal is constant for the whole request)
+        goal = kernels.goal_code(optimization_goal)
+        if goal == kernels.GoalCode.PROFIT:
+            profit_roas = np.array([m.profit_roas for m in metrics], dtype=np.float64)
+            has_margin = np.array([m.profit_margin is not None for m in metrics])
+            scores = np.where(has_margin, profit_roas, roas * 0.8)
+        elif goal == kernels.GoalCode.LTV:
+            ltv_roas = np.array([m.ltv_roas for m in metrics], dtype=np.float64)
+            has_ltv = np.array([m.ltv is not None for m in metrics])
+            scores = np.where(has_ltv, ltv_roas, roas * 1.2)
+        elif goal == kernels.GoalCode.CPA:
+            # Lower CPA is better, so invert
+            scores = kernels.score_inverse(
+                np.array([m.cpa for m in metrics], dtype=np.float64)
+            )
+        else:
+            scores = roas
+        
+        # Apply modifiers
+        status_codes = np.array([m.inventory_code for m in metrics], dtype=np.int8)
+        quality = np.array(
+            [m.audience_quality_score if m.audience_quality_score is not None else 0.5 for m in metrics],
+            dtype=np.float64
+        )
+        scores = kernels.apply_modifiers(scores, status_codes, quality)
+        
+        # Exploration bonus for low-data arms
+        return kernels.apply_exploration(scores, conversions, impressions, min_conversions)
+    
     async def _allocate_budget_fallback(
         self,
         request: BudgetAllocationRequest
     ) -> BudgetAllocationResponse:
         """Fallback rule-based budget allocation."""
-        # Calculate scores
-        scores = {}
-        for arm in request.arms:
-            score = self.score_arm(
-                arm,
-                request.min_conversions,
-                request.optimization_goal
-            )
-            scores[arm.id] = max(score, 0.0)
+        goal = request.goal_code
+        metrics = [ArmMetrics.from_state(arm) for arm in request.arms]
+        scores = self._score_arms_vectorized(metrics, request.min_conversions, goal)
+        current_budgets = np.array([m.current_budget for m in metrics], dtype=np.float64)
         
-        # Normalize scores and allocate budget
-        total_score = sum(scores.values())
-        if total_score == 0:
+        # Normalize scores and allocate budget (scores are non-negative)
+        if not scores.any():
             # Equal allocation if no scores
-            budget_per_arm = request.total_budget / len(request.arms)
+            budget_per_arm = request.total_budget / len(metrics)
             allocations = [
-                BudgetAllocation(
-                    arm_id=arm.id,
-                    platform=arm.platform,
-                    current_budget=arm.current_daily_budget or arm.spend,
+                BudgetAllocation.model_construct(
+                    arm_id=m.id,
+                    platform=m.platform,
+                    current_budget=m.current_budget,
                     new_budget=budget_per_arm,
                     change_percentage=0.0,
                     score=0.0,
                     reason="Equal allocation (no performance data)"
                 )
-                for arm in request.arms
+                for m in metrics
             ]
+            total_allocated = budget_per_arm * len(metrics)
         else:
+            shares = scores / scores.sum()
+            new_budgets = request.total_budget * shares
+            
+            # Apply max change ratio constraint
+            new_budgets = kernels.clamp_budgets(
+                new_budgets, current_budgets, request.max_change_ratio
+            )
+            change_pcts = kernels.change_percentages(new_budgets, current_budgets)
+            
             allocations = []
-            for arm in request.arms:
-                share = scores[arm.id] / total_score
-                new_budget = request.total_budget * share
-                current_budget = arm.current_daily_budget or arm.spend
-                
-                # Apply max change ratio constraint
-                max_change = current_budget * request.max_change_ratio
-                if abs(new_budget - current_budget) > max_change:
-                    if new_budget > current_budget:
-                        new_budget = current_budget + max_change
-                    else:
-                        new_budget = max(0, current_budget - max_change)
-                
-                change_pct = ((new_budget - current_budget) / current_budget * 100) if current_budget > 0 else 0.0
-                
-                # Generate reason
-                if arm.conversions < request.min_conversions:
+            total_allocated = 0.0
+            # Convert once to Python floats instead of boxing NumPy scalars per arm
+            for m, share, new_budget, change_pct, score in zip(
+                metrics,
+                shares.tolist(),
+                new_budgets.tolist(),
+                change_pcts.tolist(),
+                scores.tolist()
+            ):
+                # Generate reason from the metrics computed for scoring
+                if m.conversions < request.min_conversions:
                     reason = f"Exploration allocation ({share*100:.1f}%) - low conversion volume"
-                elif request.optimization_goal == "profit" and arm.profit_margin:
-                    reason = f"Profit-optimized allocation ({share*100:.1f}%) - profit ROAS: {arm.profit_roas:.2f}"
-                elif request.optimization_goal == "ltv" and arm.ltv:
-                    reason = f"LTV-optimized allocation ({share*100:.1f}%) - LTV ROAS: {arm.ltv_roas:.2f}"
+                elif goal == kernels.GoalCode.PROFIT and m.profit_margin:
+                    reason = f"Profit-optimized allocation ({share*100:.1f}%) - profit ROAS: {m.profit_roas:.2f}"
+                elif goal == kernels.GoalCode.LTV and m.ltv:
+                    reason = f"LTV-optimized allocation ({share*100:.1f}%) - LTV ROAS: {m.ltv_roas:.2f}"
                 else:
-                    reason = f"ROAS-based allocation ({share*100:.1f}%) - ROAS: {arm.roas:.2f}"
+                    reason = f"ROAS-based allocation ({share*100:.1f}%) - ROAS: {m.roas:.2f}"
                 
+                total_allocated += new_budget
                 allocations.append(
-                    BudgetAllocation(
-                        arm_id=arm.id,
-                        platform=arm.platform,
-                        current_budget=current_budget,
+                    BudgetAllocation.model_construct(
+                        arm_id=m.id,
+                        platform=m.platform,
+                        current_budget=m.current_budget,
                         new_budget=new_budget,
                         change_percentage=change_pct,
-                        score=scores[arm.id],
+                        score=score,
                         reason=reason
                     )
                 )
         
         return BudgetAllocationResponse(
             allocations=allocations,
-            total_allocated=sum(a.new_budget for a in allocations),
+            total_allocated=total_allocated,
             expected_improvement={
                 "estimated_roas_improvement": "5-15%",
                 "confidence": "medium",
@@ -458,10 +619,9 @@ class AdOptimizationAgent:
     ) -> CrossChannelOptimizationResponse:
         """Optimize budgets across channels using intelligent agent."""
         try:
-            self.cross_channel_agent.initialize()
             response = await self.cross_channel_agent.execute(request)
-            logger.info(f"Cross-channel optimization completed for account {request.account_id}")
+            logger.info("Cross-channel optimization completed for account %s", request.account_id)
             return response
         except Exception as e:
-            logger.error(f"Cross-channel optimization failed: {e}")
+            logger.error("Cross-channel optimization failed: %s", e)
             raise
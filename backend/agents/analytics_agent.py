@@ -134,12 +134,18 @@ class AnalyticsAgent:
             response_type=ReportResponse
         )
     
+    def warm_up(self):
+        """Initialize all sub-agents up front (call once at app startup)."""
+        for agent in (
+            self.analysis_agent,
+            self.report_agent
+        ):
+            agent.initialize()
+    
     async def analyze(self, request: AnalyticsRequest) -> AnalyticsResponse:
         """Analyze marketing performance."""
-        self.analysis_agent.initialize()
-        return await self.analysis_agent.execute(request)
+        return await self.analysis_agent.submit(request)
     
     async def generate_report(self, request: ReportRequest) -> ReportResponse:
         """Generate marketing report."""
-        self.report_agent.initialize()
         return await self.report_agent.execute(request)
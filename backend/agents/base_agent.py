@@ -1,24 +1,99 @@
 """Base agent implementation using Pydantic AI."""
-from typing import TypeVar, Generic, Dict, Any, Optional
-from datetime import datetime
-from pydantic import BaseModel
+from __future__ import annotations
+
+from typing import (
+    TYPE_CHECKING, AsyncIterator, Awaitable, Callable, Dict, Any, Iterable, List, Optional, Tuple
+)
+from uuid import uuid4
+from pydantic import BaseModel, create_model
 from pydantic_ai import Agent
+from pydantic_ai.messages import ToolCallPart
+import pydantic_core
+import asyncio
+import hashlib
 import logging
+import time
+
+import orjson
 
 from backend.services.llm_service import llm_service
 
 logger = logging.getLogger(__name__)
 
-TRequest = TypeVar('TRequest', bound=BaseModel)
-TResponse = TypeVar('TResponse', bound=BaseModel)
+if TYPE_CHECKING:
+    from typing import TypeVar
+
+    # Static typing only; request/response types are stored on the instance
+    TRequest = TypeVar('TRequest', bound=BaseModel)
+    TResponse = TypeVar('TResponse', bound=BaseModel)
 
 
-class AgentError(BaseException):
+class AgentError(Exception):
     """Base exception for agent errors."""
     pass
 
 
-class BaseAgent(Generic[TRequest, TResponse]):
+def normalize_prompt(text: str) -> str:
+    """Strip source indentation and trailing spaces from a prompt literal.
+
+    Prompts are sent on every LLM call, so whitespace left over from
+    triple-quoted source strings costs tokens on every request.
+    """
+    return "\n".join(line.strip() for line in text.strip().splitlines())
+
+
+async def gather_bounded(
+    handler: Callable[[Any], Awaitable[Any]],
+    requests: Iterable[Any],
+    concurrency: int = 16
+) -> List[Any]:
+    """Run handler over requests concurrently, at most `concurrency` at a time.
+
+    Results are returned in request order.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def run(request: Any) -> Any:
+        async with semaphore:
+            return await handler(request)
+    
+    return await asyncio.gather(*(run(request) for request in requests))
+
+
+class BulkDispatchMixin:
+    """Dispatch requests to an agent wrapper's operations.
+
+    Wrappers define `_operations`, mapping operation names to their async
+    methods, and `_handlers`, mapping request types to the same methods.
+    """
+    
+    # Upper bound on operations in flight per bulk() call
+    bulk_concurrency = 16
+    
+    async def bulk(self, requests: List[Tuple[str, BaseModel]]) -> List[Any]:
+        """Run several independent operations concurrently.
+
+        Each item is an (operation name, request) pair; results are returned
+        in the same order.
+        """
+        for name, _ in requests:
+            if name not in self._operations:
+                raise ValueError(f"Unknown operation: {name}")
+        return await gather_bounded(
+            lambda item: self._operations[item[0]](item[1]),
+            requests,
+            self.bulk_concurrency
+        )
+    
+    async def handle(self, request: BaseModel) -> Any:
+        """Dispatch a request to the operation for its type."""
+        handler = self._handlers.get(type(request))
+        if handler is None:
+            raise TypeError(f"Unsupported request type: {type(request).__name__}")
+        return await handler(request)
+
+
+class BaseAgent:
     """Base agent class for all marketing agents."""
     
     def __init__(
@@ -30,11 +105,13 @@ class BaseAgent(Generic[TRequest, TResponse]):
     ):
         """Initialize base agent."""
         self.agent_type = agent_type
-        self.system_prompt = system_prompt
+        self.system_prompt = normalize_prompt(system_prompt)
         self.request_type = request_type
         self.response_type = response_type
         self._agent: Optional[Agent] = None
         self._initialized = False
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._batcher: Optional[BatchingAgent] = None
     
     def initialize(self):
         """Initialize the agent."""
@@ -44,46 +121,149 @@ class BaseAgent(Generic[TRequest, TResponse]):
                 result_type=self.response_type
             )
             self._initialized = True
-            logger.info(f"Initialized {self.agent_type} agent")
+            logger.info("Initialized %s agent", self.agent_type)
+    
+    @staticmethod
+    def _dump_json(model: BaseModel) -> bytes:
+        """Serialize a model to compact JSON bytes.
+
+        Uses pydantic's own encoder, which handles Decimal values and
+        non-string dict keys that orjson rejects.
+        """
+        return model.model_dump_json().encode()
+    
+    @property
+    def agent(self) -> Agent:
+        """Get the Pydantic AI agent, creating it on first access."""
+        if self._agent is None:
+            self.initialize()
+        return self._agent
     
     async def execute(
         self,
         request: TRequest,
         **kwargs
     ) -> TResponse:
-        """Execute the agent with a request."""
-        if not self._initialized:
-            self.initialize()
+        """Execute the agent with a request.
+
+        Identical concurrent requests share a single in-flight run.
+        """
+        agent = self.agent
         
+        # Validate request
+        if isinstance(request, dict):
+            request = self.request_type.model_validate(request)
+        
+        if kwargs or not isinstance(request, BaseModel):
+            return await self._run(agent, request, **kwargs)
+        
+        key = hashlib.blake2b(
+            self._dump_json(request), digest_size=16
+        ).hexdigest()
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            logger.info("Joining in-flight %s agent request %s", self.agent_type, key)
+            return await asyncio.shield(inflight)
+        
+        task = asyncio.ensure_future(self._run(agent, request))
+        self._inflight[key] = task
+        task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+    
+    async def submit(self, request: TRequest) -> TResponse:
+        """Execute through a shared micro-batching window.
+
+        Concurrent submissions to the same agent within a few milliseconds
+        are sent to the LLM as one batched call.
+        """
+        if self._batcher is None:
+            self._batcher = BatchingAgent(self, flush_interval_ms=10.0)
+        return await self._batcher.execute(request)
+    
+    async def _run(
+        self,
+        agent: Agent,
+        request: TRequest,
+        **kwargs
+    ) -> TResponse:
+        """Run the underlying Pydantic AI agent once."""
         try:
-            start_time = datetime.now()
-            logger.info(f"Executing {self.agent_type} agent with request: {request}")
-            
-            # Validate request
-            if not isinstance(request, self.request_type):
-                request = self.request_type(**request) if isinstance(request, dict) else request
+            start_ns = time.perf_counter_ns()
+            logger.info("Executing %s agent with request: %s", self.agent_type, request)
             
             # Run agent
-            result = await self._agent.run(request, **kwargs)
+            prompt = self._dump_json(request).decode() if isinstance(request, BaseModel) else request
+            result = await agent.run(prompt, **kwargs)
             
             # Calculate execution time
-            execution_time = (datetime.now() - start_time).total_seconds() * 1000
+            execution_time = (time.perf_counter_ns() - start_ns) / 1_000_000
             
             logger.info(
-                f"{self.agent_type} agent completed in {execution_time:.2f}ms"
+                "%s agent completed in %.2fms", self.agent_type, execution_time
             )
             
             return result.data
             
         except Exception as e:
-            logger.error(f"Error executing {self.agent_type} agent: {str(e)}")
+            logger.error("Error executing %s agent: %s", self.agent_type, e)
             raise AgentError(f"{self.agent_type} agent failed: {str(e)}") from e
     
+    async def stream_field(
+        self,
+        request: TRequest,
+        field: str
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """Stream one long text field of the structured response.
+
+        Yields ("delta", text) as the field grows, then ("result", response)
+        with the fully validated response once the model has finished.
+        """
+        agent = self.agent
+        if isinstance(request, dict):
+            request = self.request_type.model_validate(request)
+        
+        try:
+            logger.info("Streaming %s agent with request: %s", self.agent_type, request)
+            sent = 0
+            async with agent.run_stream(self._dump_json(request).decode()) as result:
+                async for message, is_last in result.stream_structured():
+                    if not is_last:
+                        text = self._partial_field(message, field)
+                        if len(text) > sent:
+                            yield "delta", text[sent:]
+                            sent = len(text)
+                        continue
+                    response = await result.validate_structured_result(message)
+                    text = getattr(response, field)
+                    if len(text) > sent:
+                        yield "delta", text[sent:]
+                    yield "result", response
+        except Exception as e:
+            logger.error("Error streaming %s agent: %s", self.agent_type, e)
+            raise AgentError(f"{self.agent_type} agent failed: {str(e)}") from e
+    
+    @staticmethod
+    def _partial_field(message, field: str) -> str:
+        """Read a string field from the partial JSON of a streamed tool call."""
+        for part in message.parts:
+            if isinstance(part, ToolCallPart):
+                args = part.args_as_json_str()
+                try:
+                    partial = pydantic_core.from_json(args, allow_partial="trailing-strings")
+                except ValueError:
+                    return ""
+                value = partial.get(field) if isinstance(partial, dict) else None
+                return value if isinstance(value, str) else ""
+        return ""
+    
     async def cleanup(self):
         """Cleanup agent resources."""
+        if self._batcher is not None:
+            await self._batcher.close()
+            self._batcher = None
         self._agent = None
         self._initialized = False
-        logger.info(f"Cleaned up {self.agent_type} agent")
+        logger.info("Cleaned up %s agent", self.agent_type)
     
     def get_status(self) -> Dict[str, Any]:
         """Get agent status."""
@@ -95,6 +275,170 @@ class BaseAgent(Generic[TRequest, TResponse]):
         }
 
 
+class BatchingAgent:
+    """Aggregate concurrent requests to a BaseAgent into single LLM calls.
+
+    Requests arriving within ``flush_interval_ms`` of each other (up to
+    ``batch_size``) are sent in one prompt with per-item ids and the
+    structured result is demultiplexed back to each caller.
+    """
+
+    def __init__(
+        self,
+        base_agent: BaseAgent,
+        batch_size: int = 8,
+        flush_interval_ms: float = 20.0
+    ):
+        """Initialize batching wrapper."""
+        self.base_agent = base_agent
+        self.batch_size = batch_size
+        self.flush_interval_ms = flush_interval_ms
+        self._queue: Optional[asyncio.Queue] = None
+        self._flusher: Optional[asyncio.Task] = None
+        self._dispatches: set[asyncio.Task] = set()
+        self._batch_agent: Optional[Agent] = None
+        self._batch_result_type: Optional[type[BaseModel]] = None
+
+    @property
+    def batch_agent(self) -> Agent:
+        """Get the Pydantic AI agent used for multi-item prompts."""
+        if self._batch_agent is None:
+            name = self.base_agent.response_type.__name__
+            item_type = create_model(
+                f"{name}BatchItem",
+                id=(str, ...),
+                result=(self.base_agent.response_type, ...)
+            )
+            self._batch_result_type = create_model(
+                f"{name}Batch",
+                items=(List[item_type], ...)
+            )
+            self._batch_agent = llm_service.create_agent(
+                system_prompt=self.base_agent.system_prompt,
+                result_type=self._batch_result_type
+            )
+        return self._batch_agent
+
+    async def execute(self, request: TRequest) -> TResponse:
+        """Queue a request and wait for its result from the next flush."""
+        if isinstance(request, dict):
+            request = self.base_agent.request_type.model_validate(request)
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        if self._flusher is None or self._flusher.done():
+            self._queue = asyncio.Queue()
+            self._flusher = asyncio.create_task(self._flush_loop())
+
+        await self._queue.put((uuid4().hex, request, future))
+        return await future
+
+    async def _flush_loop(self):
+        """Collect queued requests into batches until the queue drains.
+
+        Each batch is dispatched as its own task, so requests arriving while
+        an LLM call is in flight start the next batch instead of waiting.
+        """
+        loop = asyncio.get_running_loop()
+        while not self._queue.empty():
+            batch = [self._queue.get_nowait()]
+            deadline = loop.time() + self.flush_interval_ms / 1000
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            task = asyncio.create_task(self._dispatch(batch))
+            self._dispatches.add(task)
+            task.add_done_callback(self._dispatches.discard)
+
+    async def close(self):
+        """Flush queued requests and wait for in-flight batches to finish."""
+        if self._flusher is not None:
+            await self._flusher
+            self._flusher = None
+        if self._dispatches:
+            await asyncio.gather(*self._dispatches, return_exceptions=True)
+
+    async def _dispatch(self, batch: List[Tuple[str, TRequest, asyncio.Future]]):
+        """Run one batch and resolve the callers' futures."""
+        try:
+            if len(batch) == 1:
+                _, request, _ = batch[0]
+                by_id = {batch[0][0]: await self.base_agent.execute(request)}
+            else:
+                by_id = await self._run_batch(batch)
+        except BaseException as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            return
+
+        missing = []
+        for request_id, request, future in batch:
+            if request_id not in by_id:
+                missing.append((request, future))
+            elif not future.done():
+                future.set_result(by_id[request_id])
+        if missing:
+            # Only the items the model dropped are retried, one call each
+            logger.warning(
+                "%s agent batch response missed %d of %d items; retrying them individually",
+                self.base_agent.agent_type, len(missing), len(batch)
+            )
+            await asyncio.gather(
+                *(self._resolve_single(request, future) for request, future in missing)
+            )
+
+    async def _resolve_single(self, request: TRequest, future: asyncio.Future):
+        """Run one request on its own and resolve its future."""
+        try:
+            result = await self.base_agent.execute(request)
+        except BaseException as e:
+            if not future.done():
+                future.set_exception(e)
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            return
+        if not future.done():
+            future.set_result(result)
+
+    async def _run_batch(
+        self,
+        batch: List[Tuple[str, TRequest, asyncio.Future]]
+    ) -> Dict[str, TResponse]:
+        """Send several requests in one prompt and return results keyed by id.
+
+        Ids the model leaves out are simply absent from the result.
+        """
+        agent = self.batch_agent
+        agent_type = self.base_agent.agent_type
+        payload = [
+            {"id": request_id, "request": request.model_dump(mode="json")}
+            for request_id, request, _ in batch
+        ]
+        prompt = (
+            f"Process the following {len(batch)} requests independently. "
+            "Return one result per request, keyed by its id.\n\n"
+            + orjson.dumps(payload).decode()
+        )
+
+        try:
+            logger.info("Executing %s agent with batch of %d requests", agent_type, len(batch))
+            result = await agent.run(prompt)
+        except Exception as e:
+            logger.error("Error executing %s agent batch: %s", agent_type, e)
+            raise AgentError(f"{agent_type} agent failed: {str(e)}") from e
+
+        return {item.id: item.result for item in result.data.items}
+
+
 class AgentResponse(BaseModel):
     """Base response model for agents."""
     success: bool = True
@@ -1,13 +1,46 @@
 """Client Communication Agent for proposals, updates, and client management."""
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from typing import AsyncIterator, List, Optional, Dict, Any, Tuple
+from pydantic import BaseModel, ConfigDict, Field
 
-from backend.agents.base_agent import BaseAgent
+from backend.agents._cache import cached_async
+from backend.agents._registry import get_or_create
+from backend.agents.base_agent import BulkDispatchMixin
+
+
+# Request submodels validate their declared fields strictly (a malformed value
+# is a 422); keys they don't declare are still accepted and kept as-is
+class ClientInfo(BaseModel):
+    """Client details."""
+    model_config = ConfigDict(extra="allow")
+    
+    name: Optional[str] = Field(default=None, description="Client name")
+    industry: Optional[str] = Field(default=None, description="Client industry")
+    company_size: Optional[str] = Field(default=None, description="Company size")
+    website: Optional[str] = Field(default=None, description="Client website")
+    contact_email: Optional[str] = Field(default=None, description="Primary contact email")
+
+
+class UpdateData(BaseModel):
+    """Data for a client update."""
+    model_config = ConfigDict(extra="allow")
+    
+    period: Optional[str] = Field(default=None, description="Reporting period")
+    metrics: Dict[str, float] = Field(default_factory=dict, description="Performance metrics")
+    highlights: List[str] = Field(default_factory=list, description="Notable events")
+
+
+class ClientPreferences(BaseModel):
+    """Client onboarding preferences."""
+    model_config = ConfigDict(extra="allow")
+    
+    communication_channel: Optional[str] = Field(default=None, description="Preferred channel")
+    reporting_frequency: Optional[str] = Field(default=None, description="Reporting frequency")
+    timezone: Optional[str] = Field(default=None, description="Client timezone")
 
 
 class ProposalRequest(BaseModel):
     """Request model for proposal generation."""
-    client_info: Dict[str, Any] = Field(..., description="Client information")
+    client_info: ClientInfo = Field(..., description="Client information")
     services: List[str] = Field(..., description="Services to propose")
     budget: Optional[float] = Field(default=None, description="Budget range")
     timeline: str = Field(..., description="Project timeline")
@@ -16,6 +49,8 @@ class ProposalRequest(BaseModel):
 
 class ProposalResponse(BaseModel):
     """Response model for proposal generation."""
+    model_config = ConfigDict(frozen=True)
+    
     proposal_content: str = Field(..., description="Proposal content")
     pricing: Dict[str, Any] = Field(..., description="Pricing breakdown")
     deliverables: List[str] = Field(..., description="List of deliverables")
@@ -30,12 +65,14 @@ class ClientUpdateRequest(BaseModel):
         ...,
         description="Type of update (performance, campaign, general)"
     )
-    data: Dict[str, Any] = Field(..., description="Update data")
+    data: UpdateData = Field(..., description="Update data")
     include_metrics: bool = Field(default=True, description="Include performance metrics")
 
 
 class ClientUpdateResponse(BaseModel):
     """Response model for client update."""
+    model_config = ConfigDict(frozen=True)
+    
     update_content: str = Field(..., description="Update content")
     next_steps: List[str] = Field(..., description="Recommended next steps")
     recommendations: List[str] = Field(
@@ -56,10 +93,21 @@ class MeetingSummaryRequest(BaseModel):
     topics_discussed: List[str] = Field(default_factory=list, description="Topics discussed")
 
 
+class ActionItem(BaseModel):
+    """Meeting action item."""
+    model_config = ConfigDict(frozen=True)
+    
+    owner: str = Field(..., description="Person responsible")
+    task: str = Field(..., description="What needs to be done")
+    due: Optional[str] = Field(default=None, description="Due date")
+
+
 class MeetingSummaryResponse(BaseModel):
     """Response model for meeting summary."""
+    model_config = ConfigDict(frozen=True)
+    
     summary: str = Field(..., description="Meeting summary")
-    action_items: List[Dict[str, str]] = Field(
+    action_items: List[ActionItem] = Field(
         default_factory=list,
         description="Action items with owners"
     )
@@ -69,13 +117,18 @@ class MeetingSummaryResponse(BaseModel):
 
 class OnboardingRequest(BaseModel):
     """Request model for client onboarding."""
-    client_info: Dict[str, Any] = Field(..., description="Client information")
+    client_info: ClientInfo = Field(..., description="Client information")
     services: List[str] = Field(..., description="Services to onboard")
-    preferences: Dict[str, Any] = Field(default_factory=dict, description="Client preferences")
+    preferences: ClientPreferences = Field(
+        default_factory=ClientPreferences,
+        description="Client preferences"
+    )
 
 
 class OnboardingResponse(BaseModel):
     """Response model for client onboarding."""
+    model_config = ConfigDict(frozen=True)
+    
     welcome_message: str = Field(..., description="Welcome message")
     onboarding_steps: List[Dict[str, Any]] = Field(
         ...,
@@ -88,66 +141,106 @@ class OnboardingResponse(BaseModel):
     timeline: Dict[str, str] = Field(..., description="Onboarding timeline")
 
 
-class ClientCommunicationAgent:
+PROPOSAL_GENERATION_PROMPT = """You are a business proposal expert. Create compelling, professional
+marketing proposals that clearly communicate value propositions, services, pricing,
+and timelines. Tailor proposals to client needs and objectives."""
+
+CLIENT_UPDATES_PROMPT = """You are a client communication specialist. Create clear,
+professional client updates that highlight performance, progress, and value.
+Include actionable insights and next steps."""
+
+MEETING_SUMMARIES_PROMPT = """You are a meeting documentation expert. Create concise, actionable
+meeting summaries with clear action items, decisions, and follow-ups. Ensure
+accountability and clarity."""
+
+CLIENT_ONBOARDING_PROMPT = """You are a client onboarding specialist. Create welcoming,
+comprehensive onboarding experiences that set clear expectations, provide helpful
+resources, and establish a strong foundation for client relationships."""
+
+
+class ClientCommunicationAgent(BulkDispatchMixin):
     """Client communication and management agent."""
     
     def __init__(self):
         """Initialize client communication agent."""
-        self.proposal_agent = BaseAgent(
-            agent_type="proposal_generation",
-            system_prompt="""You are a business proposal expert. Create compelling, professional 
-            marketing proposals that clearly communicate value propositions, services, pricing, 
-            and timelines. Tailor proposals to client needs and objectives.""",
+        self.proposal_agent = get_or_create(
+            "proposal_generation",
+            system_prompt=PROPOSAL_GENERATION_PROMPT,
             request_type=ProposalRequest,
             response_type=ProposalResponse
         )
         
-        self.update_agent = BaseAgent(
-            agent_type="client_updates",
-            system_prompt="""You are a client communication specialist. Create clear, 
-            professional client updates that highlight performance, progress, and value. 
-            Include actionable insights and next steps.""",
+        self.update_agent = get_or_create(
+            "client_updates",
+            system_prompt=CLIENT_UPDATES_PROMPT,
             request_type=ClientUpdateRequest,
             response_type=ClientUpdateResponse
         )
         
-        self.meeting_agent = BaseAgent(
-            agent_type="meeting_summaries",
-            system_prompt="""You are a meeting documentation expert. Create concise, actionable 
-            meeting summaries with clear action items, decisions, and follow-ups. Ensure 
-            accountability and clarity.""",
+        self.meeting_agent = get_or_create(
+            "meeting_summaries",
+            system_prompt=MEETING_SUMMARIES_PROMPT,
             request_type=MeetingSummaryRequest,
             response_type=MeetingSummaryResponse
         )
         
-        self.onboarding_agent = BaseAgent(
-            agent_type="client_onboarding",
-            system_prompt="""You are a client onboarding specialist. Create welcoming, 
-            comprehensive onboarding experiences that set clear expectations, provide helpful 
-            resources, and establish a strong foundation for client relationships.""",
+        self.onboarding_agent = get_or_create(
+            "client_onboarding",
+            system_prompt=CLIENT_ONBOARDING_PROMPT,
             request_type=OnboardingRequest,
             response_type=OnboardingResponse
         )
+        
+        # Operation table for BulkDispatchMixin.bulk
+        self._operations = {
+            "generate_proposal": self.generate_proposal,
+            "generate_update": self.generate_update,
+            "generate_meeting_summary": self.generate_meeting_summary,
+            "create_onboarding": self.create_onboarding
+        }
+        
+        # Handler table for BulkDispatchMixin.handle, keyed by request type
+        self._handlers = {
+            ProposalRequest: self.generate_proposal,
+            ClientUpdateRequest: self.generate_update,
+            MeetingSummaryRequest: self.generate_meeting_summary,
+            OnboardingRequest: self.create_onboarding
+        }
+    
+    def warm_up(self):
+        """Initialize all sub-agents up front (call once at app startup)."""
+        for agent in (
+            self.proposal_agent,
+            self.update_agent,
+            self.meeting_agent,
+            self.onboarding_agent
+        ):
+            agent.initialize()
     
     async def generate_proposal(self, request: ProposalRequest) -> ProposalResponse:
         """Generate a client proposal."""
-        self.proposal_agent.initialize()
-        return await self.proposal_agent.execute(request)
+        return await self.proposal_agent.submit(request)
+    
+    async def generate_proposal_stream(
+        self,
+        request: ProposalRequest
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """Stream proposal content as ("delta", text) events, then ("result", response)."""
+        async for event in self.proposal_agent.stream_field(request, "proposal_content"):
+            yield event
     
     async def generate_update(self, request: ClientUpdateRequest) -> ClientUpdateResponse:
         """Generate a client update."""
-        self.update_agent.initialize()
-        return await self.update_agent.execute(request)
+        return await self.update_agent.submit(request)
     
     async def generate_meeting_summary(
         self,
         request: MeetingSummaryRequest
     ) -> MeetingSummaryResponse:
         """Generate a meeting summary."""
-        self.meeting_agent.initialize()
-        return await self.meeting_agent.execute(request)
+        return await self.meeting_agent.submit(request)
     
+    @cached_async(ttl_seconds=3600, max_entry_bytes=256_000)
     async def create_onboarding(self, request: OnboardingRequest) -> OnboardingResponse:
         """Create client onboarding materials."""
-        self.onboarding_agent.initialize()
-        return await self.onboarding_agent.execute(request)
+        return await self.onboarding_agent.submit(request)
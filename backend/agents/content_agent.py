@@ -1,13 +1,30 @@
 """Content Creation Agent for generating marketing content."""
-from typing import List, Optional, Literal
-from pydantic import BaseModel, Field
+from typing import AsyncIterator, List, Optional, Any, Tuple
+from enum import Enum
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+from pydantic.json_schema import SkipJsonSchema
+import numpy as np
 
-from backend.agents.base_agent import BaseAgent
+from backend.agents import _text_kernels as text_kernels
+from backend.agents._cache import cached_async
+from backend.agents._registry import get_or_create
+from backend.agents.base_agent import BulkDispatchMixin
+
+
+class ContentType(str, Enum):
+    """Content formats."""
+    BLOG = "blog"
+    SOCIAL = "social"
+    EMAIL = "email"
+    AD_COPY = "ad_copy"
+    LANDING_PAGE = "landing_page"
 
 
 class ContentRequest(BaseModel):
     """Request model for content generation."""
-    content_type: Literal["blog", "social", "email", "ad_copy", "landing_page"] = Field(
+    model_config = ConfigDict(use_enum_values=True)
+    
+    content_type: ContentType = Field(
         ...,
         description="Type of content to generate"
     )
@@ -29,6 +46,8 @@ class ContentRequest(BaseModel):
 
 class ContentResponse(BaseModel):
     """Response model for content generation."""
+    model_config = ConfigDict(frozen=True)
+    
     content: str = Field(..., description="Generated content")
     seo_keywords: List[str] = Field(
         default_factory=list,
@@ -42,10 +61,11 @@ class ContentResponse(BaseModel):
         default=None,
         description="Suggested call-to-action"
     )
-    word_count: int = Field(default=0, description="Word count of generated content")
-    readability_score: Optional[float] = Field(
+    # Measured server-side after generation, so hidden from the LLM result schema
+    word_count: SkipJsonSchema[int] = Field(default=0, description="Word count of generated content")
+    readability_score: SkipJsonSchema[Optional[float]] = Field(
         default=None,
-        description="Readability score"
+        description="Flesch reading ease of the content"
     )
 
 
@@ -58,6 +78,10 @@ class ContentBrief(BaseModel):
     target_audience: str = Field(..., description="Target audience description")
 
 
+# Upper bound on calendar slots; every date is inlined into the LLM prompt
+MAX_CALENDAR_DATES = 366
+
+
 class ContentCalendarRequest(BaseModel):
     """Request model for content calendar suggestions."""
     start_date: str = Field(..., description="Start date for calendar")
@@ -65,10 +89,24 @@ class ContentCalendarRequest(BaseModel):
     content_types: List[str] = Field(default_factory=list, description="Types of content")
     topics: List[str] = Field(default_factory=list, description="Content topics")
     frequency: str = Field(default="weekly", description="Posting frequency")
+    dates: List[str] = Field(
+        default_factory=list,
+        max_length=MAX_CALENDAR_DATES,
+        description="Publication dates to plan (one calendar item per date)"
+    )
+    
+    @model_validator(mode="after")
+    def expand_dates(self) -> "ContentCalendarRequest":
+        """Fill `dates` from the range, rejecting reversed or oversized ranges."""
+        if not self.dates:
+            self.dates = build_date_grid(self.start_date, self.end_date, self.frequency)
+        return self
 
 
 class ContentCalendarItem(BaseModel):
     """Content calendar item."""
+    model_config = ConfigDict(frozen=True)
+    
     date: str
     content_type: str
     topic: str
@@ -78,45 +116,145 @@ class ContentCalendarItem(BaseModel):
 
 class ContentCalendarResponse(BaseModel):
     """Response model for content calendar."""
+    model_config = ConfigDict(frozen=True)
+    
     calendar_items: List[ContentCalendarItem] = Field(
         default_factory=list,
         description="Suggested content calendar items"
     )
 
 
-class ContentAgent:
+# Posting frequency -> step between publication dates
+_FREQUENCY_STEPS = {
+    "daily": np.timedelta64(1, "D"),
+    "weekly": np.timedelta64(7, "D"),
+    "biweekly": np.timedelta64(14, "D"),
+    "monthly": np.timedelta64(1, "M"),
+}
+
+
+def build_date_grid(start_date: str, end_date: str, frequency: str) -> List[str]:
+    """Expand a date range into ISO publication dates at the given frequency.
+
+    Returns an empty list for unknown frequencies or unparseable dates.
+    Raises ValueError if the range ends before it starts or would produce
+    more than MAX_CALENDAR_DATES dates.
+    """
+    step = _FREQUENCY_STEPS.get(frequency.lower())
+    if step is None:
+        return []
+    try:
+        start = np.datetime64(start_date, "D")
+        end = np.datetime64(end_date, "D")
+    except ValueError:
+        return []
+    if end < start:
+        raise ValueError("end_date must not be before start_date")
+    monthly = step.dtype == np.dtype("m8[M]")
+    if monthly:
+        count = int(end.astype("datetime64[M]") - start.astype("datetime64[M]")) + 1
+    else:
+        count = int((end - start) // step) + 1
+    if count > MAX_CALENDAR_DATES:
+        raise ValueError(
+            f"Date range yields {count} {frequency} dates; the limit is {MAX_CALENDAR_DATES}"
+        )
+    if monthly:
+        # Same day of month, clipped to month length
+        months = np.arange(
+            start.astype("datetime64[M]"), end.astype("datetime64[M]") + 1, step
+        )
+        day = start - start.astype("datetime64[M]").astype("datetime64[D]")
+        next_months = (months + 1).astype("datetime64[D]")
+        grid = np.minimum(months.astype("datetime64[D]") + day, next_months - 1)
+        grid = grid[grid <= end]
+    else:
+        grid = np.arange(start, end + 1, step)
+    return np.datetime_as_string(grid, unit="D").tolist()
+
+
+CONTENT_GENERATION_PROMPT = """You are an expert content writer specializing in digital marketing.
+Create engaging, SEO-optimized content for various formats including blog posts,
+social media posts, email campaigns, and ad copy. Ensure content is tailored to
+the target audience and aligns with brand voice."""
+
+CONTENT_CALENDAR_PROMPT = """You are a content strategist. Create content calendars that align
+with marketing goals, audience preferences, and optimal posting schedules. Suggest
+topics, content types, and timing for maximum engagement. When publication dates
+are provided, create exactly one item for each date."""
+
+
+class ContentAgent(BulkDispatchMixin):
     """Content creation and management agent."""
     
     def __init__(self):
         """Initialize content agent."""
-        self.generation_agent = BaseAgent(
-            agent_type="content_generation",
-            system_prompt="""You are an expert content writer specializing in digital marketing. 
-            Create engaging, SEO-optimized content for various formats including blog posts, 
-            social media posts, email campaigns, and ad copy. Ensure content is tailored to 
-            the target audience and aligns with brand voice.""",
+        self.generation_agent = get_or_create(
+            "content_generation",
+            system_prompt=CONTENT_GENERATION_PROMPT,
             request_type=ContentRequest,
             response_type=ContentResponse
         )
         
-        self.calendar_agent = BaseAgent(
-            agent_type="content_calendar",
-            system_prompt="""You are a content strategist. Create content calendars that align 
-            with marketing goals, audience preferences, and optimal posting schedules. Suggest 
-            topics, content types, and timing for maximum engagement.""",
+        self.calendar_agent = get_or_create(
+            "content_calendar",
+            system_prompt=CONTENT_CALENDAR_PROMPT,
             request_type=ContentCalendarRequest,
             response_type=ContentCalendarResponse
         )
+        
+        # Operation table for BulkDispatchMixin.bulk
+        self._operations = {
+            "generate_content": self.generate_content,
+            "create_content_calendar": self.create_content_calendar
+        }
+        
+        # Handler table for BulkDispatchMixin.handle, keyed by request type
+        self._handlers = {
+            ContentRequest: self.generate_content,
+            ContentCalendarRequest: self.create_content_calendar
+        }
+    
+    def warm_up(self):
+        """Initialize all sub-agents up front (call once at app startup)."""
+        for agent in (
+            self.generation_agent,
+            self.calendar_agent
+        ):
+            agent.initialize()
     
     async def generate_content(self, request: ContentRequest) -> ContentResponse:
         """Generate marketing content."""
-        self.generation_agent.initialize()
-        return await self.generation_agent.execute(request)
+        response = await self.generation_agent.submit(request)
+        return self._with_text_stats(response)
     
+    async def generate_content_stream(
+        self,
+        request: ContentRequest
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """Stream generated content as ("delta", text) events, then ("result", response)."""
+        async for event, value in self.generation_agent.stream_field(request, "content"):
+            if event == "result":
+                value = self._with_text_stats(value)
+            yield event, value
+    
+    @staticmethod
+    def _with_text_stats(response: ContentResponse) -> ContentResponse:
+        """Replace LLM-reported text stats with values measured from the content."""
+        buf = text_kernels.text_buffer(response.content)
+        return response.model_copy(update={
+            "word_count": text_kernels.count_words(buf),
+            "readability_score": round(text_kernels.flesch_reading_ease(buf), 1)
+        })
+    
+    @cached_async(ttl_seconds=3600, max_entry_bytes=256_000)
     async def create_content_calendar(
         self,
         request: ContentCalendarRequest
     ) -> ContentCalendarResponse:
-        """Create content calendar."""
-        self.calendar_agent.initialize()
-        return await self.calendar_agent.execute(request)
+        """Create content calendar.
+        
+        The request carries its date skeleton (expanded on validation), so the
+        LLM only fills in each slot.
+        """
+        return await self.calendar_agent.submit(request)
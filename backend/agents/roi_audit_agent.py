@@ -1,14 +1,63 @@
 """ROI Audit Agent for detecting tracking issues and misconfigurations."""
-from typing import List, Optional, Dict, Any, Literal
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple
 from pydantic import BaseModel, Field
 from datetime import datetime, timedelta
+from itertools import chain
 import logging
 
-from backend.agents.base_agent import BaseAgent
+import numpy as np
+
+from backend.agents import _bandit_kernels as kernels
+from backend.agents.base_agent import BaseAgent, gather_bounded
 from backend.agents.ad_optimization_agent import ArmState
 
 logger = logging.getLogger(__name__)
 
+# Integer codes for issue severities, in order of urgency
+SEVERITY_CODES = {"critical": 0, "high": 1, "medium": 2, "low": 3}
+
+
+def _arms_to_soa(arms: List[ArmState]) -> Dict[str, np.ndarray]:
+    """Unpack arm states into parallel per-field arrays."""
+    count = len(arms)
+    return {
+        "id": np.array([arm.id for arm in arms], dtype=object),
+        "platform": np.array([arm.platform for arm in arms], dtype=object),
+        "spend": np.fromiter((arm.spend for arm in arms), dtype=np.float64, count=count),
+        "conversions": np.fromiter((arm.conversions for arm in arms), dtype=np.int64, count=count),
+        "roas": np.fromiter((arm.roas for arm in arms), dtype=np.float64, count=count),
+        "has_ltv": np.fromiter((arm.ltv is not None for arm in arms), dtype=bool, count=count),
+        "has_margin": np.fromiter(
+            (arm.profit_margin is not None for arm in arms), dtype=bool, count=count
+        ),
+        "inventory_code": np.fromiter(
+            (arm.inventory_code for arm in arms),
+            dtype=np.int8,
+            count=count
+        ),
+    }
+
+
+def _issues_in_arm_order(
+    rules: List[Tuple[np.ndarray, Callable[[int], Any]]]
+) -> List[Any]:
+    """Build issues for flagged arms, grouped by arm and then by rule.
+
+    Each rule is a (mask over arms, issue builder) pair, listed in the order
+    the rules are checked for a single arm.
+    """
+    if not rules:
+        return []
+    arm_index = np.concatenate([np.flatnonzero(mask) for mask, _ in rules])
+    rule_index = np.concatenate([
+        np.full(np.count_nonzero(mask), rank, dtype=np.intp) for rank, (mask, _) in enumerate(rules)
+    ])
+    order = np.lexsort((rule_index, arm_index))
+    return [
+        rules[rule][1](arm)
+        for arm, rule in zip(arm_index[order].tolist(), rule_index[order].tolist())
+    ]
+
 
 class TrackingIssue(BaseModel):
     """Detected tracking issue."""
@@ -132,13 +181,16 @@ class ROIAuditAgent:
             response_type=ROIAuditResponse
         )
     
+    def warm_up(self):
+        """Initialize the agent up front (call once at app startup)."""
+        self.agent.initialize()
+    
     async def audit(
         self,
         request: ROIAuditRequest
     ) -> ROIAuditResponse:
         """Perform ROI audit using intelligent agent."""
         try:
-            self.agent.initialize()
             response = await self.agent.execute(request)
             logger.info(f"ROI audit completed for account {request.account_id}")
             return response
@@ -146,101 +198,125 @@ class ROIAuditAgent:
             logger.warning(f"Agent audit failed, falling back to rule-based: {e}")
             return await self._audit_fallback(request)
     
+    async def audit_batch(
+        self,
+        requests: List[ROIAuditRequest],
+        concurrency: int = 16
+    ) -> List[ROIAuditResponse]:
+        """Audit several accounts concurrently, preserving request order."""
+        return await gather_bounded(self.audit, requests, concurrency)
+    
     async def _audit_fallback(
         self,
         request: ROIAuditRequest
     ) -> ROIAuditResponse:
         """Fallback rule-based ROI audit."""
-        tracking_issues = []
-        config_issues = []
+        platform_configs = request.platform_configs or {}
+        capi_enabled = bool(
+            platform_configs.get("facebook", {}).get("conversions_api_enabled", False)
+        )
+        enhanced_conversions_enabled = bool(
+            platform_configs.get("google", {}).get("enhanced_conversions_enabled", False)
+        )
         
-        # Check for tracking issues
-        for arm in request.arms:
-            # Missing conversions with spend
-            if arm.spend > 0 and arm.conversions == 0:
-                tracking_issues.append(
-                    TrackingIssue(
-                        issue_type="missing_conversions",
-                        severity="critical",
-                        description=f"Arm {arm.id} has ${arm.spend:.2f} spend but zero conversions",
-                        affected_arms=[arm.id],
-                        recommendation="Check conversion tracking setup, verify pixels are firing",
-                        estimated_impact="High - Smart Bidding cannot optimize without conversion data"
-                    )
-                )
-            
-            # Low conversion volume
-            if arm.conversions > 0 and arm.conversions < 10 and arm.spend > 100:
-                tracking_issues.append(
-                    TrackingIssue(
-                        issue_type="low_conversion_volume",
-                        severity="high",
-                        description=f"Arm {arm.id} has only {arm.conversions} conversions with ${arm.spend:.2f} spend",
-                        affected_arms=[arm.id],
-                        recommendation="Increase conversion volume or extend time window for data collection",
-                        estimated_impact="Medium - Smart Bidding needs more data for reliable optimization"
-                    )
-                )
-            
-            # Negative ROAS
-            if arm.roas < 0.5 and arm.spend > 500:
-                config_issues.append(
-                    ConfigurationIssue(
-                        issue_type="negative_roas",
-                        severity="high",
-                        description=f"Arm {arm.id} has ROAS of {arm.roas:.2f} (spending ${arm.spend:.2f})",
-                        platform=arm.platform,
-                        recommendation="Review campaign targeting, creatives, or consider pausing",
-                        estimated_impact="High - Wasting ad spend"
-                    )
-                )
-            
-            # Missing LTV when optimizing for LTV
-            if request.optimization_goal == "ltv" and arm.ltv is None:
-                config_issues.append(
-                    ConfigurationIssue(
-                        issue_type="missing_ltv_data",
-                        severity="medium",
-                        description=f"Arm {arm.id} missing LTV data but optimizing for LTV",
-                        platform=arm.platform,
-                        recommendation="Set up LTV tracking or switch optimization goal to ROAS",
-                        estimated_impact="Medium - Cannot optimize for LTV without LTV data"
-                    )
-                )
-            
-            # Missing profit margin when optimizing for profit
-            if request.optimization_goal == "profit" and arm.profit_margin is None:
-                config_issues.append(
-                    ConfigurationIssue(
-                        issue_type="missing_profit_margin",
-                        severity="medium",
-                        description=f"Arm {arm.id} missing profit margin but optimizing for profit",
-                        platform=arm.platform,
-                        recommendation="Add profit margin data or switch optimization goal to ROAS",
-                        estimated_impact="Medium - Cannot optimize for profit without margin data"
-                    )
-                )
-            
-            # Out of stock inventory
-            if arm.inventory_status == "out_of_stock" and arm.spend > 0:
-                config_issues.append(
-                    ConfigurationIssue(
-                        issue_type="out_of_stock_campaign",
-                        severity="high",
-                        description=f"Arm {arm.id} is out of stock but still spending",
-                        platform=arm.platform,
-                        recommendation="Pause campaign or update inventory status",
-                        estimated_impact="High - Wasting spend on unavailable products"
-                    )
-                )
+        soa = _arms_to_soa(request.arms)
+        spend = soa["spend"]
+        conversions = soa["conversions"]
+        roas = soa["roas"]
+        ids = soa["id"]
+        platforms = soa["platform"]
+        
+        # Flag every rule in one pass; issues are only built for flagged arms.
+        # Issue fields are literals or already-validated arm values, so they
+        # are constructed without re-validation.
+        missing_conversions = np.logical_and(spend > 0, conversions == 0)
+        low_volume = np.logical_and.reduce((conversions > 0, conversions < 10, spend > 100))
+        negative_roas = np.logical_and(roas < 0.5, spend > 500)
+        out_of_stock = np.logical_and(
+            soa["inventory_code"] == kernels.InventoryStatusCode.OUT, spend > 0
+        )
+        
+        def missing_conversions_issue(i):
+            return TrackingIssue.model_construct(
+                issue_type="missing_conversions",
+                severity="critical",
+                description=f"Arm {ids[i]} has ${spend[i]:.2f} spend but zero conversions",
+                affected_arms=[ids[i]],
+                recommendation="Check conversion tracking setup, verify pixels are firing",
+                estimated_impact="High - Smart Bidding cannot optimize without conversion data"
+            )
+        
+        def low_volume_issue(i):
+            return TrackingIssue.model_construct(
+                issue_type="low_conversion_volume",
+                severity="high",
+                description=f"Arm {ids[i]} has only {conversions[i]} conversions with ${spend[i]:.2f} spend",
+                affected_arms=[ids[i]],
+                recommendation="Increase conversion volume or extend time window for data collection",
+                estimated_impact="Medium - Smart Bidding needs more data for reliable optimization"
+            )
+        
+        def negative_roas_issue(i):
+            return ConfigurationIssue.model_construct(
+                issue_type="negative_roas",
+                severity="high",
+                description=f"Arm {ids[i]} has ROAS of {roas[i]:.2f} (spending ${spend[i]:.2f})",
+                platform=platforms[i],
+                recommendation="Review campaign targeting, creatives, or consider pausing",
+                estimated_impact="High - Wasting ad spend"
+            )
+        
+        def missing_ltv_issue(i):
+            return ConfigurationIssue.model_construct(
+                issue_type="missing_ltv_data",
+                severity="medium",
+                description=f"Arm {ids[i]} missing LTV data but optimizing for LTV",
+                platform=platforms[i],
+                recommendation="Set up LTV tracking or switch optimization goal to ROAS",
+                estimated_impact="Medium - Cannot optimize for LTV without LTV data"
+            )
+        
+        def missing_margin_issue(i):
+            return ConfigurationIssue.model_construct(
+                issue_type="missing_profit_margin",
+                severity="medium",
+                description=f"Arm {ids[i]} missing profit margin but optimizing for profit",
+                platform=platforms[i],
+                recommendation="Add profit margin data or switch optimization goal to ROAS",
+                estimated_impact="Medium - Cannot optimize for profit without margin data"
+            )
+        
+        def out_of_stock_issue(i):
+            return ConfigurationIssue.model_construct(
+                issue_type="out_of_stock_campaign",
+                severity="high",
+                description=f"Arm {ids[i]} is out of stock but still spending",
+                platform=platforms[i],
+                recommendation="Pause campaign or update inventory status",
+                estimated_impact="High - Wasting spend on unavailable products"
+            )
+        
+        tracking_issues = _issues_in_arm_order([
+            (missing_conversions, missing_conversions_issue),
+            (low_volume, low_volume_issue),
+        ])
+        
+        config_rules = [(negative_roas, negative_roas_issue)]
+        # Missing LTV when optimizing for LTV
+        if request.optimization_goal == "ltv":
+            config_rules.append((~soa["has_ltv"], missing_ltv_issue))
+        # Missing profit margin when optimizing for profit
+        if request.optimization_goal == "profit":
+            config_rules.append((~soa["has_margin"], missing_margin_issue))
+        config_rules.append((out_of_stock, out_of_stock_issue))
+        config_issues = _issues_in_arm_order(config_rules)
         
         # Check platform-specific configurations
-        if request.platform_configs:
+        if platform_configs:
             # Facebook-specific checks
-            fb_config = request.platform_configs.get("facebook", {})
-            if not fb_config.get("conversions_api_enabled", False):
+            if not capi_enabled:
                 config_issues.append(
-                    ConfigurationIssue(
+                    ConfigurationIssue.model_construct(
                         issue_type="missing_capi",
                         severity="high",
                         description="Facebook Conversions API (CAPI) not enabled",
@@ -251,10 +327,9 @@ class ROIAuditAgent:
                 )
             
             # Google-specific checks
-            google_config = request.platform_configs.get("google", {})
-            if not google_config.get("enhanced_conversions_enabled", False):
+            if not enhanced_conversions_enabled:
                 config_issues.append(
-                    ConfigurationIssue(
+                    ConfigurationIssue.model_construct(
                         issue_type="missing_enhanced_conversions",
                         severity="high",
                         description="Google Enhanced Conversions not enabled",
@@ -265,9 +340,14 @@ class ROIAuditAgent:
                 )
         
         # Calculate health score
-        critical_count = len([i for i in tracking_issues + config_issues if i.severity == "critical"])
-        high_count = len([i for i in tracking_issues + config_issues if i.severity == "high"])
-        medium_count = len([i for i in tracking_issues + config_issues if i.severity == "medium"])
+        severity_codes = np.fromiter(
+            (SEVERITY_CODES[issue.severity] for issue in chain(tracking_issues, config_issues)),
+            dtype=np.int8
+        )
+        severity_counts = np.bincount(severity_codes, minlength=len(SEVERITY_CODES))
+        critical_count = int(severity_counts[SEVERITY_CODES["critical"]])
+        high_count = int(severity_counts[SEVERITY_CODES["high"]])
+        medium_count = int(severity_counts[SEVERITY_CODES["medium"]])
         
         # Health score: 100 - (critical * 20 + high * 10 + medium * 5)
         health_score = max(0, 100 - (critical_count * 20 + high_count * 10 + medium_count * 5))
@@ -278,9 +358,9 @@ class ROIAuditAgent:
             recommendations.append(f"Fix {critical_count} critical issue(s) immediately")
         if high_count > 0:
             recommendations.append(f"Address {high_count} high-priority issue(s)")
-        if not request.platform_configs or not request.platform_configs.get("facebook", {}).get("conversions_api_enabled"):
+        if not capi_enabled:
             recommendations.append("Set up Facebook Conversions API for better tracking")
-        if not request.platform_configs or not request.platform_configs.get("google", {}).get("enhanced_conversions_enabled"):
+        if not enhanced_conversions_enabled:
             recommendations.append("Enable Google Enhanced Conversions")
         
         return ROIAuditResponse(
@@ -2,7 +2,7 @@
 from typing import List, Optional, Dict, Any
 from pydantic import BaseModel, Field
 
-from backend.agents.base_agent import BaseAgent
+from backend.agents.base_agent import BaseAgent, gather_bounded
 
 
 class SEOAnalysisRequest(BaseModel):
@@ -94,15 +94,29 @@ class SEOAgent:
             response_type=KeywordResearchResponse
         )
     
+    def warm_up(self):
+        """Initialize all sub-agents up front (call once at app startup)."""
+        for agent in (
+            self.analysis_agent,
+            self.keyword_agent
+        ):
+            agent.initialize()
+    
     async def analyze_seo(self, request: SEOAnalysisRequest) -> SEOAnalysisResponse:
         """Perform SEO analysis."""
-        self.analysis_agent.initialize()
         return await self.analysis_agent.execute(request)
     
+    async def analyze_seo_batch(
+        self,
+        requests: List[SEOAnalysisRequest],
+        concurrency: int = 16
+    ) -> List[SEOAnalysisResponse]:
+        """Analyze several pages concurrently, preserving request order."""
+        return await gather_bounded(self.analyze_seo, requests, concurrency)
+    
     async def research_keywords(
         self,
         request: KeywordResearchRequest
     ) -> KeywordResearchResponse:
         """Research keywords."""
-        self.keyword_agent.initialize()
         return await self.keyword_agent.execute(request)
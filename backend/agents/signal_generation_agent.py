@@ -1,10 +1,13 @@
 """Signal Generation Agent for converting business events to high-quality platform signals."""
-from typing import List, Optional, Dict, Any, Literal
+from typing import Callable, List, Optional, Dict, Any, Literal, Tuple
 from pydantic import BaseModel, Field
+from collections import Counter
 from datetime import datetime
+from functools import lru_cache
 import logging
+import math
 
-from backend.agents.base_agent import BaseAgent
+from backend.agents.base_agent import BaseAgent, gather_bounded
 
 logger = logging.getLogger(__name__)
 
@@ -82,6 +85,83 @@ class SignalGenerationResponse(BaseModel):
     )
 
 
+# (classification, platform event name, conversion value)
+Classification = Tuple[str, str, float]
+
+
+def _classify_purchase(
+    event: BusinessEvent,
+    request: SignalGenerationRequest,
+    ltv_by_user: Dict[str, LTVData]
+) -> Optional[Classification]:
+    """Classify a purchase; returns None when it has no revenue to report."""
+    if event.revenue is None:
+        return None
+    
+    # Check if high-value purchase
+    is_high_value = False
+    value = event.revenue
+    
+    # Check LTV data
+    ltv_data = ltv_by_user.get(event.user_id)
+    if ltv_data and ltv_data.predicted_ltv and ltv_data.predicted_ltv > value * 1.5:
+        is_high_value = True
+        value = ltv_data.predicted_ltv
+    
+    # Check profit margins
+    product_id = event.metadata.get("product_id")
+    if request.profit_margins and product_id:
+        margin = request.profit_margins.get(product_id, 0.2)
+        value = event.revenue * margin
+    
+    classification = "high_value_purchase" if is_high_value else "purchase"
+    return classification, "Purchase", value
+
+
+def _classify_lead(
+    event: BusinessEvent,
+    request: SignalGenerationRequest,
+    ltv_by_user: Dict[str, LTVData]
+) -> Classification:
+    """Classify a lead against the CRM qualification rules."""
+    # Simple qualification check
+    is_qualified = bool(request.qualification_rules) and event.metadata.get("qualified", False)
+    classification = "qualified_lead" if is_qualified else "lead"
+    return classification, "Lead", event.revenue or 10.0  # Default lead value
+
+
+def _classify_trial_start(
+    event: BusinessEvent,
+    request: SignalGenerationRequest,
+    ltv_by_user: Dict[str, LTVData]
+) -> Classification:
+    """Classify a signup or trial start."""
+    return "trial_start", "CompleteRegistration", event.revenue or 0.0
+
+
+def _classify_other(
+    event: BusinessEvent,
+    request: SignalGenerationRequest,
+    ltv_by_user: Dict[str, LTVData]
+) -> Classification:
+    """Pass any other event type through under its own name."""
+    return event.event_type, event.event_type, event.revenue or 0.0
+
+
+@lru_cache(maxsize=64)
+def _reasoning_for(classification: str) -> str:
+    """Shared reasoning text for a fallback classification."""
+    return f"Classified as {classification} based on event type and business rules"
+
+
+_EVENT_HANDLERS: Dict[str, Callable[..., Optional[Classification]]] = {
+    "purchase": _classify_purchase,
+    "lead": _classify_lead,
+    "signup": _classify_trial_start,
+    "trial_start": _classify_trial_start,
+}
+
+
 class SignalGenerationAgent:
     """Agent for generating high-quality conversion signals for ad platforms."""
     
@@ -137,7 +217,6 @@ class SignalGenerationAgent:
     ) -> SignalGenerationResponse:
         """Generate platform-optimized signals from business events."""
         try:
-            self.agent.initialize()
             response = await self.agent.execute(request)
             logger.info(f"Generated {len(response.signals)} signals for {request.platform}")
             return response
@@ -146,6 +225,14 @@ class SignalGenerationAgent:
             # Fallback to rule-based signal generation
             return await self._generate_signals_fallback(request)
     
+    async def generate_signals_batch(
+        self,
+        requests: List[SignalGenerationRequest],
+        concurrency: int = 16
+    ) -> List[SignalGenerationResponse]:
+        """Generate signals for several requests concurrently, preserving order."""
+        return await gather_bounded(self.generate_signals, requests, concurrency)
+    
     async def _generate_signals_fallback(
         self,
         request: SignalGenerationRequest
@@ -153,86 +240,57 @@ class SignalGenerationAgent:
         """Fallback rule-based signal generation."""
         signals = []
         issues = []
-        total_value = 0.0
+        event_values = []
+        signals_by_platform: Counter = Counter()
+        
+        # Index LTV rows by user once; reversed so the first row per user wins
+        ltv_by_user = {
+            ltv.user_id: ltv
+            for ltv in reversed(request.ltv_data or [])
+            if ltv.user_id is not None
+        }
+        
+        platforms = ("facebook", "google") if request.platform == "both" else (request.platform,)
         
         for event in request.events:
-            # Basic classification
-            if event.event_type == "purchase":
-                if event.revenue is None:
-                    issues.append(f"Purchase event {event.event_id} missing revenue")
-                    continue
-                
-                # Check if high-value purchase
-                is_high_value = False
-                value = event.revenue
-                
-                # Check LTV data
-                ltv_data = None
-                if request.ltv_data:
-                    ltv_data = next(
-                        (ltv for ltv in request.ltv_data if ltv.user_id == event.user_id),
-                        None
-                    )
-                    if ltv_data and ltv_data.predicted_ltv and ltv_data.predicted_ltv > value * 1.5:
-                        is_high_value = True
-                        value = ltv_data.predicted_ltv
-                
-                # Check profit margins
-                if request.profit_margins and event.metadata.get("product_id"):
-                    margin = request.profit_margins.get(event.metadata["product_id"], 0.2)
-                    value = event.revenue * margin
-                
-                classification = "high_value_purchase" if is_high_value else "purchase"
-                event_name = "Purchase" if not is_high_value else "Purchase"
-                
-            elif event.event_type == "lead":
-                # Check qualification rules
-                is_qualified = False
-                if request.qualification_rules:
-                    # Simple qualification check
-                    is_qualified = event.metadata.get("qualified", False)
-                
-                classification = "qualified_lead" if is_qualified else "lead"
-                event_name = "Lead" if not is_qualified else "Lead"
-                value = event.revenue or 10.0  # Default lead value
-                
-            elif event.event_type == "signup" or event.event_type == "trial_start":
-                classification = "trial_start"
-                event_name = "CompleteRegistration"
-                value = event.revenue or 0.0
-                
-            else:
-                classification = event.event_type
-                event_name = event.event_type
-                value = event.revenue or 0.0
+            handler = _EVENT_HANDLERS.get(event.event_type, _classify_other)
+            classified = handler(event, request, ltv_by_user)
+            if classified is None:
+                issues.append(f"Purchase event {event.event_id} missing revenue")
+                continue
+            classification, event_name, value = classified
+            # Values can come from caller-supplied margins, which may be negative
+            if value < 0:
+                issues.append(f"Event {event.event_id} has negative conversion value {value:.2f}")
+                continue
             
-            # Generate signals for requested platforms
-            platforms = ["facebook", "google"] if request.platform == "both" else [request.platform]
+            # Identifiers may arrive as numbers in metadata; platforms expect strings
+            user_data = {}
+            if email := event.metadata.get("email"):
+                user_data["email"] = str(email)
+            if phone := event.metadata.get("phone"):
+                user_data["phone"] = str(phone)
             
+            # Generate signals for requested platforms
             for platform in platforms:
-                user_data = {
-                    "email": event.metadata.get("email", ""),
-                    "phone": event.metadata.get("phone", ""),
-                }
-                
                 signal = PlatformSignal(
                     platform=platform,
                     event_name=event_name,
-                    event_id=f"{event.event_id}_{platform}",
+                    event_id=event.event_id + "_" + platform,
                     value=value,
                     currency=event.currency,
                     timestamp=event.timestamp,
-                    user_data={k: v for k, v in user_data.items() if v},
-                    custom_data=event.metadata,
+                    user_data=dict(user_data),
+                    custom_data=dict(event.metadata),
                     classification=classification,
-                    reasoning=f"Classified as {classification} based on event type and business rules"
+                    reasoning=_reasoning_for(classification)
                 )
                 signals.append(signal)
-                total_value += value
+                signals_by_platform[platform] += 1
+            event_values.append(value)
         
-        signals_by_platform = {}
-        for signal in signals:
-            signals_by_platform[signal.platform] = signals_by_platform.get(signal.platform, 0) + 1
+        # Every event is signalled once per platform
+        total_value = math.fsum(event_values) * len(platforms)
         
         return SignalGenerationResponse(
             signals=signals,
@@ -243,6 +301,6 @@ class SignalGenerationAgent:
                 "Add profit margin data for accurate value calculation"
             ] if not request.ltv_data or not request.qualification_rules else [],
             total_value=total_value,
-            signals_by_platform=signals_by_platform
+            signals_by_platform=dict(signals_by_platform)
         )
 
@@ -1,7 +1,7 @@
 """Social Media Agent for managing social media posts and analytics."""
 from typing import List, Optional, Dict, Any
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 from backend.agents.base_agent import BaseAgent
 
@@ -14,7 +14,7 @@ class SocialPostRequest(BaseModel):
         default=None,
         description="URLs of media files to attach"
     )
-    scheduled_time: Optional[str] = Field(
+    scheduled_time: Optional[datetime] = Field(
         default=None,
         description="Scheduled posting time (ISO format)"
     )
@@ -44,14 +44,19 @@ class SocialPostResponse(BaseModel):
 class SocialAnalyticsRequest(BaseModel):
     """Request model for social media analytics."""
     platform: str = Field(..., description="Social media platform")
-    date_range: Dict[str, str] = Field(
-        ...,
-        description="Date range for analytics (start_date, end_date)"
-    )
+    start_date: datetime = Field(..., description="Start of the analytics window (ISO format)")
+    end_date: datetime = Field(..., description="End of the analytics window (ISO format)")
     metrics: List[str] = Field(
         default_factory=list,
         description="Metrics to retrieve"
     )
+    
+    @model_validator(mode="after")
+    def check_date_order(self) -> "SocialAnalyticsRequest":
+        """Reject windows that end before they start."""
+        if self.end_date < self.start_date:
+            raise ValueError("end_date must not be before start_date")
+        return self
 
 
 class SocialAnalyticsResponse(BaseModel):
@@ -127,9 +132,17 @@ class SocialMediaAgent:
             response_type=HashtagResearchResponse
         )
     
+    def warm_up(self):
+        """Initialize all sub-agents up front (call once at app startup)."""
+        for agent in (
+            self.posting_agent,
+            self.analytics_agent,
+            self.hashtag_agent
+        ):
+            agent.initialize()
+    
     async def create_post(self, request: SocialPostRequest) -> SocialPostResponse:
         """Create a social media post."""
-        self.posting_agent.initialize()
         return await self.posting_agent.execute(request)
     
     async def get_analytics(
@@ -137,7 +150,6 @@ class SocialMediaAgent:
         request: SocialAnalyticsRequest
     ) -> SocialAnalyticsResponse:
         """Get social media analytics."""
-        self.analytics_agent.initialize()
         return await self.analytics_agent.execute(request)
     
     async def research_hashtags(
@@ -145,5 +157,4 @@ class SocialMediaAgent:
         request: HashtagResearchRequest
     ) -> HashtagResearchResponse:
         """Research hashtags."""
-        self.hashtag_agent.initialize()
         return await self.hashtag_agent.execute(request)
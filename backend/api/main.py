@@ -1,48 +1,93 @@
 """FastAPI application main file."""
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+from logging.handlers import QueueHandler, QueueListener
 import logging
+import queue
 
 from backend.config.settings import settings
+from backend.api import response_cache
 from backend.api.routes import agents, tasks
+from backend.services.http_client import close_http_client
 
 # Configure logging
-logging.basicConfig(level=logging.INFO)
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+)
 logger = logging.getLogger(__name__)
 
+IS_DEV = settings.environment == "development"
+
+
+def start_log_queue() -> QueueListener:
+    """Move the root handlers behind a queue serviced by a background thread.
+
+    Handlers then only enqueue records, so logging never blocks the event
+    loop on stream I/O. The configured handlers (and their formatters) are
+    reused by the listener. Per-request access lines come from uvicorn's
+    access log.
+    """
+    root = logging.getLogger()
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *root.handlers, respect_handler_level=True)
+    root.handlers = [QueueHandler(log_queue)]
+    listener.start()
+    return listener
+
+
+def stop_log_queue(listener: QueueListener):
+    """Flush queued records and put the original handlers back on the root logger."""
+    listener.stop()
+    logging.getLogger().handlers = list(listener.handlers)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup/shutdown."""
+    log_listener = start_log_queue()
+    try:
+        agents.warm_up_agents()
+        yield
+    finally:
+        await close_http_client()
+        stop_log_queue(log_listener)
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Digital Marketing Agent System API",
     description="Backend API for digital marketing automation agents",
     version="0.1.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
-# Configure CORS
+# Serve repeat calls to idempotent agent endpoints from Redis. Registered
+# before CORS so it runs inside it and cached hits still get CORS headers.
+app.middleware("http")(response_cache.cache_responses)
+
+# Configure CORS: browsers reject "*" on credentialed requests, so list origins
+DEV_CORS_ORIGINS = ["http://localhost:3000", "http://localhost:8000"]
+cors_origins = settings.cors_origins or (DEV_CORS_ORIGINS if IS_DEV else [])
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"] if settings.environment == "development" else [],
+    allow_origins=cors_origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
 
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    """Log all requests."""
-    logger.info(f"{request.method} {request.url.path}")
-    response = await call_next(request)
-    return response
-
-
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     """Global exception handler."""
     logger.error(f"Unhandled exception: {str(exc)}", exc_info=True)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={"detail": "Internal server error"}
     )
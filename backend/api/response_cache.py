@@ -0,0 +1,151 @@
+"""Redis-backed response cache for idempotent agent endpoints."""
+from typing import Optional
+import asyncio
+import hashlib
+import logging
+import secrets
+import time
+
+from fastapi import Request, Response
+
+from backend.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Path -> TTL in seconds; only these endpoints are cached
+CACHE_TTLS = {
+    "/api/v1/agents/seo/keyword-research": 600,
+    "/api/v1/agents/social-media/hashtags": 1800,
+    "/api/v1/agents/ad-optimization/roi-audit": 300,
+    "/api/v1/agents/ad-optimization/fetch-arms": 30,
+}
+
+# Only these methods are cached; OPTIONS preflights and writes always pass through
+CACHEABLE_METHODS = frozenset({"GET", "POST"})
+
+# How long a miss holds the fill lock, and how long others wait on it
+LOCK_TTL_SECONDS = 30
+LOCK_WAIT_SECONDS = 2.0
+LOCK_POLL_SECONDS = 0.05
+
+# Deletes the fill lock only if it still holds this request's token
+RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+# After a Redis failure, skip the cache for this long instead of retrying per request
+RETRY_AFTER_SECONDS = 30.0
+
+_client = None
+_disabled_until = 0.0
+
+
+def _get_client():
+    """Return the shared Redis client, or None while Redis is unavailable."""
+    global _client, _disabled_until
+    if _client is None and time.monotonic() >= _disabled_until:
+        try:
+            import redis.asyncio as redis
+        except ImportError:
+            logger.warning("redis is not installed; response caching disabled")
+            _disabled_until = float("inf")
+            return None
+        _client = redis.from_url(settings.redis_url, socket_connect_timeout=0.5)
+    return _client
+
+
+def _mark_unavailable(error: Exception):
+    """Bypass the cache for a while after a Redis error."""
+    global _client, _disabled_until
+    logger.warning("Response cache unavailable, bypassing for %ss: %s", RETRY_AFTER_SECONDS, error)
+    _client = None
+    _disabled_until = time.monotonic() + RETRY_AFTER_SECONDS
+
+
+async def _cache_key(request: Request) -> str:
+    """Key a request by method, path, query string and body."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(request.method.encode())
+    digest.update(request.url.path.encode())
+    digest.update(request.url.query.encode())
+    digest.update(await request.body())
+    return "response-cache:" + digest.hexdigest()
+
+
+async def _lookup(client, key: str) -> Optional[Response]:
+    """Return the cached response for key, if any."""
+    cached = await client.hgetall(key)
+    if not cached:
+        return None
+    return Response(
+        content=cached[b"body"],
+        status_code=int(cached[b"status"]),
+        media_type="application/json",
+        headers={"X-Cache": "HIT"}
+    )
+
+
+async def cache_responses(request: Request, call_next):
+    """Serve repeat calls to cacheable endpoints from Redis.
+
+    Only GET/POST calls to paths in CACHE_TTLS are considered, and only
+    successful responses are stored. The first miss for a key takes a short
+    lock so concurrent identical requests wait for it rather than all calling
+    the LLM. Any Redis error falls through to the handler.
+    """
+    ttl = CACHE_TTLS.get(request.url.path)
+    cacheable = ttl and request.method in CACHEABLE_METHODS and settings.enable_caching
+    client = _get_client() if cacheable else None
+    if client is None:
+        return await call_next(request)
+
+    key = await _cache_key(request)
+    lock_key = key + ":lock"
+    token = secrets.token_hex(16)
+    acquired = False
+    try:
+        cached = await _lookup(client, key)
+        if cached is not None:
+            return cached
+        acquired = bool(await client.set(lock_key, token, nx=True, ex=LOCK_TTL_SECONDS))
+        if not acquired:
+            # Another request is filling this key; wait briefly for it
+            deadline = time.monotonic() + LOCK_WAIT_SECONDS
+            while time.monotonic() < deadline:
+                await asyncio.sleep(LOCK_POLL_SECONDS)
+                cached = await _lookup(client, key)
+                if cached is not None:
+                    return cached
+    except Exception as e:
+        _mark_unavailable(e)
+        return await call_next(request)
+
+    try:
+        response = await call_next(request)
+        if response.status_code != 200:
+            return response
+
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        try:
+            async with client.pipeline(transaction=True) as pipe:
+                pipe.hset(key, mapping={"status": response.status_code, "body": body})
+                pipe.expire(key, ttl)
+                await pipe.execute()
+        except Exception as e:
+            _mark_unavailable(e)
+    finally:
+        # Release our fill lock even if the handler raised; a request that
+        # timed out waiting never held it and must not release another's
+        if acquired:
+            try:
+                await client.eval(RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+            except Exception as e:
+                _mark_unavailable(e)
+
+    headers = dict(response.headers)
+    headers.pop("content-length", None)
+    headers["X-Cache"] = "MISS"
+    return Response(content=body, status_code=response.status_code, headers=headers)
@@ -1,44 +1,103 @@
 """Agent API routes."""
-from fastapi import APIRouter, HTTPException, Depends
-from typing import Dict, Any, Optional, List
+from fastapi import APIRouter, HTTPException, Depends, Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.routing import APIRoute
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel
+from typing import AsyncIterator, Callable, Coroutine, Any, Optional, List, Tuple
 from sqlalchemy.orm import Session
+import logging
+
+import orjson
 
 from backend.models.database import get_db
 from backend.models.schemas import TaskCreate, TaskResponse
-from backend.agents.seo_agent import SEOAgent, SEOAnalysisRequest, KeywordResearchRequest
-from backend.agents.content_agent import ContentAgent, ContentRequest, ContentCalendarRequest
+from backend.agents.seo_agent import (
+    SEOAgent,
+    SEOAnalysisRequest,
+    SEOAnalysisResponse,
+    KeywordResearchRequest,
+    KeywordResearchResponse
+)
+from backend.agents.content_agent import (
+    ContentAgent,
+    ContentRequest,
+    ContentResponse,
+    ContentCalendarRequest,
+    ContentCalendarResponse
+)
 from backend.agents.social_media_agent import (
     SocialMediaAgent,
     SocialPostRequest,
+    SocialPostResponse,
     SocialAnalyticsRequest,
-    HashtagResearchRequest
+    SocialAnalyticsResponse,
+    HashtagResearchRequest,
+    HashtagResearchResponse
+)
+from backend.agents.analytics_agent import (
+    AnalyticsAgent,
+    AnalyticsRequest,
+    AnalyticsResponse,
+    ReportRequest,
+    ReportResponse
 )
-from backend.agents.analytics_agent import AnalyticsAgent, AnalyticsRequest, ReportRequest
 from backend.agents.campaign_agent import (
     CampaignAgent,
     CampaignRequest,
+    CampaignResponse,
     CampaignOptimizationRequest,
-    ABTestRequest
+    CampaignOptimizationResponse,
+    ABTestRequest,
+    ABTestResponse
 )
 from backend.agents.client_communication_agent import (
     ClientCommunicationAgent,
     ProposalRequest,
+    ProposalResponse,
     ClientUpdateRequest,
+    ClientUpdateResponse,
     MeetingSummaryRequest,
-    OnboardingRequest
+    MeetingSummaryResponse,
+    OnboardingRequest,
+    OnboardingResponse
 )
 from backend.agents.ad_optimization_agent import (
+    ARM_LIST_ADAPTER,
     AdOptimizationAgent,
+    ArmState,
     BudgetAllocationRequest,
-    CrossChannelOptimizationRequest
+    BudgetAllocationResponse,
+    CrossChannelOptimizationRequest,
+    CrossChannelOptimizationResponse
 )
 from backend.agents.roi_audit_agent import (
     ROIAuditAgent,
-    ROIAuditRequest
+    ROIAuditRequest,
+    ROIAuditResponse
 )
 from backend.services.optimization_service import OptimizationService
 
-router = APIRouter()
+
+
+class AgentRoute(APIRoute):
+    """Route that reports unhandled handler errors as a 500 with their message."""
+    
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+        
+        async def route_handler(request: Request) -> Response:
+            try:
+                return await handler(request)
+            except (HTTPException, RequestValidationError):
+                raise
+            except Exception as e:
+                raise HTTPException(status_code=500, detail=str(e))
+        
+        return route_handler
+
+
+router = APIRouter(route_class=AgentRoute)
 
 # Initialize agents
 seo_agent = SEOAgent()
@@ -51,195 +110,220 @@ ad_optimization_agent = AdOptimizationAgent()
 roi_audit_agent = ROIAuditAgent()
 optimization_service = OptimizationService()
 
+logger = logging.getLogger(__name__)
+
+
+class NewClientResponse(BaseModel):
+    """Proposal and onboarding materials for a new client."""
+    proposal: ProposalResponse
+    onboarding: OnboardingResponse
+
+
+def warm_up_agents():
+    """Initialize sub-agents at startup so requests skip LLM agent setup."""
+    for wrapper in (
+        seo_agent,
+        content_agent,
+        social_media_agent,
+        analytics_agent,
+        campaign_agent,
+        client_communication_agent,
+        ad_optimization_agent,
+        roi_audit_agent
+    ):
+        try:
+            wrapper.warm_up()
+        except ValueError as e:
+            # Missing API key: leave agents to initialize lazily on first use
+            logger.warning("Skipping agent warm-up: %s", e)
+            return
+
+
+def _json_response(model: BaseModel) -> Response:
+    """Serialize a response model with its compiled serializer.
+
+    Returning bytes directly skips FastAPI's jsonable_encoder walk and
+    response_model re-validation of the dumped dict.
+    """
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
+
+async def _sse(events: AsyncIterator[Tuple[str, Any]]) -> AsyncIterator[bytes]:
+    """Encode (event, value) pairs from a streaming agent as server-sent events."""
+    try:
+        async for event, value in events:
+            data = value.model_dump(mode="json") if event == "result" else value
+            yield b"event: " + event.encode() + b"\ndata: " + orjson.dumps(data) + b"\n\n"
+    except Exception as e:
+        # Headers are already sent, so report failures in-band
+        yield b"event: error\ndata: " + orjson.dumps(str(e)) + b"\n\n"
+
 
 # SEO Agent Endpoints
-@router.post("/seo/analyze", response_model=Dict[str, Any])
+@router.post("/seo/analyze", response_model=SEOAnalysisResponse)
 async def analyze_seo(request: SEOAnalysisRequest):
     """Perform SEO analysis."""
-    try:
-        result = await seo_agent.analyze_seo(request)
-        return result.model_dump()
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    result = await seo_agent.analyze_seo(request)
+    return _json_response(result)
 
 
-@router.post("/seo/keyword-research", response_model=Dict[str, Any])
+@router.post("/seo/keyword-research", response_model=KeywordResearchResponse)
 async def research_keywords(request: KeywordResearchRequest):
     """Research keywords."""
-    try:
-        result = await seo_agent.research_keywords(request)
-        return result.model_dump()
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    result = await seo_agent.research_keywords(request)
+    return _json_response(result)
 
 
 # Content Agent Endpoints
-@router.post("/content/generate", response_model=Dict[str, Any])
+@router.post("/content/generate", response_model=ContentResponse)
 async def generate_content(request: ContentRequest):
     """Generate marketing content."""
-    try:
-        result = await content_agent.generate_content(request)
-        return result.model_dump()
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    result = await content_agent.generate_content(request)
+    return _json_response(result)
+
 
+@router.post("/content/generate/stream")
+async def generate_content_stream(request: ContentRequest):
+    """Stream generated marketing content as server-sent events."""
+    return StreamingResponse(
+        _sse(content_agent.generate_content_stream(request)),
+        media_type="text/event-stream"
+    )
 
-@router.post("/content/calendar", response_model=Dict[str, Any])
+
+@router.post("/content/calendar", response_model=ContentCalendarResponse)
 async def create_content_calendar(request: ContentCalendarRequest):
     """Create content calendar."""
-    try:
-        result = await content_agent.create_content_calendar(request)
-        return result.model_dump()
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    result = await content_agent.create_content_calendar(request)
+    return _json_response(result)
 
 
 # Social Media Agent Endpoints
-@router.post("/social-media/post", response_model=Dict[str, Any])
+@router.post("/social-media/post", response_model=SocialPostResponse)
 async def create_social_post(request: SocialPostRequest):
     """Create a social media post."""
-    try:
-        result = await social_media_agent.create_post(request)
-        return result.model_dump()
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    result = await social_media_agent.create_post(request)
+    return _json_response(result)
 
 
-@router.post("/social-media/analytics", response_model=Dict[str, Any])
+@router.post("/social-media/analytics", response_model=SocialAnalyticsResponse)
 async def get_social_analytics(request: SocialAnalyticsRequest):
     """Get social media analytics."""
-    try:
-        result = await social_media_agent.get_analytics(request)
-        return result.model_dump()
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    result = await social_media_agent.get_analytics(request)
+    return _json_response(result)
 
 
-@router.post("/social-media/hashtags", response_model=Dict[str, Any])
+@router.post("/social-media/hashtags", response_model=HashtagResearchResponse)
 async def research_hashtags(request: HashtagResearchRequest):
     """Research hashtags."""
-    try:
-        result = await social_media_agent.research_hashtags(request)
-        return result.model_dump()
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    result = await social_media_agent.research_hashtags(request)
+    return _json_response(result)
 
 
 # Analytics Agent Endpoints
-@router.post("/analytics/analyze", response_model=Dict[str, Any])
+@router.post("/analytics/analyze", response_model=AnalyticsResponse)
 async def analyze_analytics(request: AnalyticsRequest):
     """Analyze marketing performance."""
-    try:
-        result = await analytics_agent.analyze(request)
-        return result.model_dump()
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    result = await analytics_agent.analyze(request)
+    return _json_response(result)
 
 
-@router.post("/analytics/report", response_model=Dict[str, Any])
+@router.post("/analytics/report", response_model=ReportResponse)
 async def generate_report(request: ReportRequest):
     """Generate marketing report."""
-    try:
-        result = await analytics_agent.generate_report(request)
-        return result.model_dump()
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    result = await analytics_agent.generate_report(request)
+    return _json_response(result)
 
 
 # Campaign Agent Endpoints
-@router.post("/campaign/create", response_model=Dict[str, Any])
+@router.post("/campaign/create", response_model=CampaignResponse)
 async def create_campaign(request: CampaignRequest):
     """Create a marketing campaign."""
-    try:
-        result = await campaign_agent.create_campaign(request)
-        return result.model_dump()
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    result = await campaign_agent.create_campaign(request)
+    return _json_response(result)
 
 
-@router.post("/campaign/optimize", response_model=Dict[str, Any])
+@router.post("/campaign/optimize", response_model=CampaignOptimizationResponse)
 async def optimize_campaign(request: CampaignOptimizationRequest):
     """Optimize a campaign."""
-    try:
-        result = await campaign_agent.optimize_campaign(request)
-        return result.model_dump()
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    result = await campaign_agent.optimize_campaign(request)
+    return _json_response(result)
 
 
-@router.post("/campaign/ab-test", response_model=Dict[str, Any])
+@router.post("/campaign/ab-test", response_model=ABTestResponse)
 async def create_ab_test(request: ABTestRequest):
     """Create an A/B test."""
-    try:
-        result = await campaign_agent.create_ab_test(request)
-        return result.model_dump()
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    result = await campaign_agent.create_ab_test(request)
+    return _json_response(result)
 
 
 # Client Communication Agent Endpoints
-@router.post("/client/proposal", response_model=Dict[str, Any])
+@router.post("/client/proposal", response_model=ProposalResponse)
 async def generate_proposal(request: ProposalRequest):
     """Generate a client proposal."""
-    try:
-        result = await client_communication_agent.generate_proposal(request)
-        return result.model_dump()
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    result = await client_communication_agent.generate_proposal(request)
+    return _json_response(result)
+
 
+@router.post("/client/proposal/stream")
+async def generate_proposal_stream(request: ProposalRequest):
+    """Stream a client proposal as server-sent events."""
+    return StreamingResponse(
+        _sse(client_communication_agent.generate_proposal_stream(request)),
+        media_type="text/event-stream"
+    )
 
-@router.post("/client/update", response_model=Dict[str, Any])
+
+@router.post("/client/update", response_model=ClientUpdateResponse)
 async def generate_client_update(request: ClientUpdateRequest):
     """Generate a client update."""
-    try:
-        result = await client_communication_agent.generate_update(request)
-        return result.model_dump()
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    result = await client_communication_agent.generate_update(request)
+    return _json_response(result)
 
 
-@router.post("/client/meeting-summary", response_model=Dict[str, Any])
+@router.post("/client/meeting-summary", response_model=MeetingSummaryResponse)
 async def generate_meeting_summary(request: MeetingSummaryRequest):
     """Generate a meeting summary."""
-    try:
-        result = await client_communication_agent.generate_meeting_summary(request)
-        return result.model_dump()
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    result = await client_communication_agent.generate_meeting_summary(request)
+    return _json_response(result)
 
 
-@router.post("/client/onboarding", response_model=Dict[str, Any])
+@router.post("/client/onboarding", response_model=OnboardingResponse)
 async def create_onboarding(request: OnboardingRequest):
     """Create client onboarding materials."""
-    try:
-        result = await client_communication_agent.create_onboarding(request)
-        return result.model_dump()
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    result = await client_communication_agent.create_onboarding(request)
+    return _json_response(result)
+
+
+@router.post("/client/new-client", response_model=NewClientResponse)
+async def new_client(proposal: ProposalRequest, onboarding: OnboardingRequest):
+    """Generate a proposal and onboarding materials concurrently."""
+    proposal_result, onboarding_result = await client_communication_agent.bulk([
+        ("generate_proposal", proposal),
+        ("create_onboarding", onboarding)
+    ])
+    return _json_response(NewClientResponse.model_construct(
+        proposal=proposal_result,
+        onboarding=onboarding_result
+    ))
 
 
 # Ad Optimization Agent Endpoints
-@router.post("/ad-optimization/allocate-budget", response_model=Dict[str, Any])
+@router.post("/ad-optimization/allocate-budget", response_model=BudgetAllocationResponse)
 async def allocate_budget(request: BudgetAllocationRequest):
     """Allocate budget across campaigns/adsets."""
-    try:
-        result = await ad_optimization_agent.allocate_budget(request)
-        return result.model_dump()
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    result = await ad_optimization_agent.allocate_budget(request)
+    return _json_response(result)
 
 
-@router.post("/ad-optimization/cross-channel", response_model=Dict[str, Any])
+@router.post("/ad-optimization/cross-channel", response_model=CrossChannelOptimizationResponse)
 async def optimize_cross_channel(request: CrossChannelOptimizationRequest):
     """Optimize budgets across channels."""
-    try:
-        result = await ad_optimization_agent.optimize_cross_channel(request)
-        return result.model_dump()
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    result = await ad_optimization_agent.optimize_cross_channel(request)
+    return _json_response(result)
 
 
-@router.post("/ad-optimization/run-optimization", response_model=Dict[str, Any])
+@router.post("/ad-optimization/run-optimization", response_model=None)
 async def run_optimization(
     account_id: str,
     total_budget: float,
@@ -249,46 +333,38 @@ async def run_optimization(
     optimization_goal: str = "roas"
 ):
     """Run a single optimization cycle (fetch data, allocate budget)."""
-    try:
-        result = await optimization_service.optimize_once(
-            account_id=account_id,
-            total_budget=total_budget,
-            facebook_account_id=facebook_account_id,
-            google_customer_id=google_customer_id,
-            time_window=time_window,
-            optimization_goal=optimization_goal
-        )
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
-
-
-@router.get("/ad-optimization/fetch-arms", response_model=List[Dict[str, Any]])
+    result = await optimization_service.optimize_once(
+        account_id=account_id,
+        total_budget=total_budget,
+        facebook_account_id=facebook_account_id,
+        google_customer_id=google_customer_id,
+        time_window=time_window,
+        optimization_goal=optimization_goal
+    )
+    # Result shape varies by outcome, so encode it directly rather than via a model
+    return ORJSONResponse(result)
+
+
+@router.get("/ad-optimization/fetch-arms", response_model=List[ArmState])
 async def fetch_arms(
     facebook_account_id: Optional[str] = None,
     google_customer_id: Optional[str] = None,
     time_window: str = "yesterday"
 ):
     """Fetch arm states from platforms."""
-    try:
-        arms = await optimization_service.fetch_arm_states(
-            facebook_account_id=facebook_account_id,
-            google_customer_id=google_customer_id,
-            time_window=time_window
-        )
-        return [arm.model_dump() for arm in arms]
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    arms = await optimization_service.fetch_arm_states(
+        facebook_account_id=facebook_account_id,
+        google_customer_id=google_customer_id,
+        time_window=time_window
+    )
+    return Response(content=ARM_LIST_ADAPTER.dump_json(arms), media_type="application/json")
 
 
-@router.post("/ad-optimization/roi-audit", response_model=Dict[str, Any])
+@router.post("/ad-optimization/roi-audit", response_model=ROIAuditResponse)
 async def perform_roi_audit(request: ROIAuditRequest):
     """Perform ROI audit to detect tracking and configuration issues."""
-    try:
-        result = await roi_audit_agent.audit(request)
-        return result.model_dump()
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    result = await roi_audit_agent.audit(request)
+    return _json_response(result)
 
 
 @router.get("/status")
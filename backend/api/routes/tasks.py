@@ -1,49 +1,70 @@
 """Task API routes."""
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query
 from typing import List, Optional
+from sqlalchemy import func, insert, update
 from sqlalchemy.orm import Session
-from datetime import datetime
 
 from backend.models.database import get_db
-from backend.models.schemas import TaskCreate, TaskResponse, TaskBase
+from backend.models.schemas import TaskCreate, TaskResponse, TaskBase, TaskListResponse
 from backend.models.schemas import Task as TaskModel
 
 router = APIRouter()
 
 
 @router.post("/", response_model=TaskResponse)
-async def create_task(
+def create_task(
     task: TaskCreate,
     db: Session = Depends(get_db)
 ):
     """Create a new task."""
     try:
-        db_task = TaskModel(
-            client_id=task.client_id,
-            campaign_id=task.campaign_id,
-            agent_type=task.agent_type,
-            status="pending",
-            input_data=task.input_data
-        )
-        db.add(db_task)
+        # INSERT ... RETURNING yields the generated columns without a refresh
+        db_task = db.scalars(
+            insert(TaskModel).values(status="pending", **task.model_dump()).returning(TaskModel)
+        ).one()
+        response = TaskResponse.from_orm_fast(db_task)
+        db.commit()
+        return response
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/batch", response_model=List[TaskResponse])
+def create_tasks(
+    tasks: List[TaskCreate],
+    db: Session = Depends(get_db)
+):
+    """Create several tasks in one statement and transaction."""
+    if not tasks:
+        return []
+    try:
+        db_tasks = db.scalars(
+            insert(TaskModel).returning(TaskModel, sort_by_parameter_order=True),
+            [{"status": "pending", **task.model_dump()} for task in tasks]
+        ).all()
+        response = [TaskResponse.from_orm_fast(task) for task in db_tasks]
         db.commit()
-        db.refresh(db_task)
-        return TaskResponse.model_validate(db_task)
+        return response
     except Exception as e:
         db.rollback()
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/", response_model=List[TaskResponse])
-async def get_tasks(
+@router.get("/", response_model=TaskListResponse)
+def get_tasks(
     client_id: Optional[int] = None,
     campaign_id: Optional[int] = None,
     status: Optional[str] = None,
-    skip: int = 0,
-    limit: int = 100,
+    cursor: Optional[int] = None,
+    limit: int = Query(100, ge=1, le=500),
     db: Session = Depends(get_db)
 ):
-    """Get tasks with optional filters."""
+    """Get tasks with optional filters, newest first.
+
+    Pages are keyed on task id: pass the previous page's `next_cursor` as
+    `cursor` to continue, so each page costs the same regardless of depth.
+    """
     try:
         query = db.query(TaskModel)
         
@@ -53,24 +74,29 @@ async def get_tasks(
             query = query.filter(TaskModel.campaign_id == campaign_id)
         if status:
             query = query.filter(TaskModel.status == status)
+        if cursor is not None:
+            query = query.filter(TaskModel.id < cursor)
         
-        tasks = query.offset(skip).limit(limit).all()
-        return [TaskResponse.model_validate(task) for task in tasks]
+        tasks = query.order_by(TaskModel.id.desc()).limit(limit).all()
+        return TaskListResponse(
+            items=[TaskResponse.from_orm_fast(task) for task in tasks],
+            next_cursor=tasks[-1].id if tasks and len(tasks) == limit else None
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/{task_id}", response_model=TaskResponse)
-async def get_task(
+def get_task(
     task_id: int,
     db: Session = Depends(get_db)
 ):
     """Get a specific task."""
     try:
-        task = db.query(TaskModel).filter(TaskModel.id == task_id).first()
+        task = db.get(TaskModel, task_id)
         if not task:
             raise HTTPException(status_code=404, detail="Task not found")
-        return TaskResponse.model_validate(task)
+        return TaskResponse.from_orm_fast(task)
     except HTTPException:
         raise
     except Exception as e:
@@ -78,7 +104,7 @@ async def get_task(
 
 
 @router.patch("/{task_id}", response_model=TaskResponse)
-async def update_task(
+def update_task(
     task_id: int,
     status: Optional[str] = None,
     output_data: Optional[dict] = None,
@@ -87,24 +113,31 @@ async def update_task(
 ):
     """Update a task."""
     try:
-        task = db.query(TaskModel).filter(TaskModel.id == task_id).first()
-        if not task:
-            raise HTTPException(status_code=404, detail="Task not found")
-        
+        # updated_at is set by the column's onupdate; timestamps use the DB clock
+        values = {}
         if status:
-            task.status = status
+            values["status"] = status
         if output_data is not None:
-            task.output_data = output_data
+            values["output_data"] = output_data
         if error_message:
-            task.error_message = error_message
-        
+            values["error_message"] = error_message
         if status == "completed":
-            task.completed_at = datetime.utcnow()
+            values["completed_at"] = func.now()
+        
+        # Single UPDATE ... RETURNING instead of SELECT then UPDATE
+        task = db.scalars(
+            update(TaskModel)
+            .where(TaskModel.id == task_id)
+            .values(**values)
+            .returning(TaskModel)
+        ).first()
+        if not task:
+            raise HTTPException(status_code=404, detail="Task not found")
         
-        task.updated_at = datetime.utcnow()
+        # Read before commit, which would expire the row and force a reload
+        response = TaskResponse.from_orm_fast(task)
         db.commit()
-        db.refresh(task)
-        return TaskResponse.model_validate(task)
+        return response
     except HTTPException:
         raise
     except Exception as e:
@@ -113,13 +146,13 @@ async def update_task(
 
 
 @router.delete("/{task_id}")
-async def delete_task(
+def delete_task(
     task_id: int,
     db: Session = Depends(get_db)
 ):
     """Delete a task."""
     try:
-        task = db.query(TaskModel).filter(TaskModel.id == task_id).first()
+        task = db.get(TaskModel, task_id)
         if not task:
             raise HTTPException(status_code=404, detail="Task not found")
         
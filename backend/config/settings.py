@@ -1,6 +1,7 @@
 """Application settings and configuration."""
 import os
-from typing import Literal
+from functools import lru_cache
+from typing import List, Literal
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
@@ -21,6 +22,11 @@ class Settings(BaseSettings):
         default="openai",
         alias="LLM_PROVIDER"
     )
+    llm_max_connections: int = Field(default=200, alias="LLM_MAX_CONNECTIONS")
+    llm_max_keepalive_connections: int = Field(
+        default=100,
+        alias="LLM_MAX_KEEPALIVE_CONNECTIONS"
+    )
     
     # Redis
     redis_url: str = Field(
@@ -38,6 +44,7 @@ class Settings(BaseSettings):
         default=30,
         alias="API_ACCESS_TOKEN_EXPIRE_MINUTES"
     )
+    cors_origins: List[str] = Field(default_factory=list, alias="CORS_ORIGINS")
     
     # External API Keys
     google_ads_api_key: str = Field(default="", alias="GOOGLE_ADS_API_KEY")
@@ -63,5 +70,11 @@ class Settings(BaseSettings):
         case_sensitive = False
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings (usable as a FastAPI dependency)."""
+    return Settings()
+
+
 # Global settings instance
-settings = Settings()
+settings = get_settings()
@@ -12,6 +12,8 @@ engine = create_engine(
     pool_pre_ping=True,
     pool_size=10,
     max_overflow=20,
+    # Room for every filter combination of the hot task/client queries
+    query_cache_size=1200,
     echo=settings.environment == "development"
 )
 
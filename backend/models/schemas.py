@@ -2,7 +2,7 @@
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 from pydantic import BaseModel, Field, EmailStr
-from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, Boolean, Float, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, Boolean, Float, ForeignKey, Index, func
 from sqlalchemy.orm import relationship
 
 from backend.models.database import Base
@@ -20,8 +20,8 @@ class Client(Base):
     company_name = Column(String(255))
     phone = Column(String(50))
     address = Column(Text)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     is_active = Column(Boolean, default=True)
     metadata = Column(JSON, default=dict)
     
@@ -44,8 +44,8 @@ class Campaign(Base):
     objectives = Column(JSON, default=list)
     channels = Column(JSON, default=list)
     target_audience = Column(JSON, default=dict)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     metadata = Column(JSON, default=dict)
     
     client = relationship("Client", back_populates="campaigns")
@@ -64,12 +64,20 @@ class Task(Base):
     input_data = Column(JSON, default=dict)
     output_data = Column(JSON, default=dict)
     error_message = Column(Text)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    completed_at = Column(DateTime)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    completed_at = Column(DateTime(timezone=True))
     
     client = relationship("Client", back_populates="tasks")
     campaign = relationship("Campaign", back_populates="tasks")
+    
+    __table_args__ = (
+        # Serves filtered, newest-first keyset pagination in get_tasks
+        Index("ix_tasks_filter", client_id, campaign_id, status, id.desc()),
+        # Queue-style lookups: oldest tasks in a status, and a client's tasks by status
+        Index("ix_tasks_status_created", status, created_at),
+        Index("ix_tasks_client_status", client_id, status),
+    )
 
 
 class AgentExecution(Base):
@@ -85,7 +93,12 @@ class AgentExecution(Base):
     token_usage = Column(JSON, default=dict)
     status = Column(String(50), default="completed")
     error_message = Column(Text)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    __table_args__ = (
+        # Execution history per agent, newest first
+        Index("ix_agent_exec_type_created", agent_type, created_at),
+    )
 
 
 class AnalyticsData(Base):
@@ -99,15 +112,31 @@ class AnalyticsData(Base):
     date = Column(DateTime, nullable=False)
     metrics = Column(JSON, default=dict)
     dimensions = Column(JSON, default=dict)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     __table_args__ = (
+        # Reporting queries filter by owner and date range
+        Index("ix_analytics_client_date", client_id, date),
+        Index("ix_analytics_campaign_date", campaign_id, date),
         {"comment": "Stores aggregated analytics data"}
     )
 
 
 # ==================== Pydantic Schemas ====================
 
+class FromORMFast:
+    """Mixin for response schemas built from trusted database rows."""
+    
+    @classmethod
+    def from_orm_fast(cls, row):
+        """Build the schema from an ORM row without validation.
+        
+        Only use for rows read from our own database; inbound data must go
+        through model_validate.
+        """
+        return cls.model_construct(**{name: getattr(row, name) for name in cls.model_fields})
+
+
 class ClientBase(BaseModel):
     """Base client schema."""
     name: str
@@ -132,7 +161,7 @@ class ClientUpdate(BaseModel):
     is_active: Optional[bool] = None
 
 
-class ClientResponse(ClientBase):
+class ClientResponse(FromORMFast, ClientBase):
     """Client response schema."""
     id: int
     created_at: datetime
@@ -160,7 +189,7 @@ class CampaignCreate(CampaignBase):
     client_id: int
 
 
-class CampaignResponse(CampaignBase):
+class CampaignResponse(FromORMFast, CampaignBase):
     """Campaign response schema."""
     id: int
     client_id: int
@@ -184,7 +213,7 @@ class TaskCreate(TaskBase):
     campaign_id: Optional[int] = None
 
 
-class TaskResponse(TaskBase):
+class TaskResponse(FromORMFast, TaskBase):
     """Task response schema."""
     id: int
     client_id: Optional[int]
@@ -200,7 +229,16 @@ class TaskResponse(TaskBase):
         from_attributes = True
 
 
-class AgentExecutionResponse(BaseModel):
+class TaskListResponse(BaseModel):
+    """Page of tasks, newest first."""
+    items: List[TaskResponse]
+    next_cursor: Optional[int] = Field(
+        default=None,
+        description="Pass as `cursor` to fetch the next page; null on the last page"
+    )
+
+
+class AgentExecutionResponse(FromORMFast, BaseModel):
     """Agent execution response schema."""
     id: int
     agent_type: str
@@ -0,0 +1,29 @@
+"""Shared HTTP client for ad platform and analytics API calls."""
+from typing import Optional
+import importlib.util
+import httpx
+
+# httpx needs the optional h2 package for HTTP/2; without it, stay on HTTP/1.1
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the pooled client so keep-alive connections are reused across requests."""
+    global _client
+    if _client is None:
+        # HTTP/2 multiplexes concurrent calls to the same API host on one connection
+        _client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+        )
+    return _client
+
+
+async def close_http_client():
+    """Close the pooled client; the next call to get_http_client opens a new one."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -1,13 +1,26 @@
 """Facebook Ads API integration."""
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
-import httpx
+from itertools import islice
+import asyncio
 import logging
 
+import orjson
+
 from backend.config.settings import settings
+from backend.services.http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
+# Action types counted as conversions in performance summaries
+CONVERSION_ACTION_TYPES = frozenset({"purchase", "lead", "complete_registration"})
+
+# Conversions API accepts at most this many events per /events call
+CAPI_MAX_EVENTS_PER_REQUEST = 1000
+
+# Upper bound on pages followed per Graph API edge read
+GRAPH_MAX_PAGES = 100
+
 
 class FacebookAdsIntegration:
     """Facebook Marketing API integration service."""
@@ -18,6 +31,44 @@ class FacebookAdsIntegration:
         self.api_version = "v19.0"
         self.base_url = f"https://graph.facebook.com/{self.api_version}"
     
+    async def _get_all_pages(
+        self,
+        url: str,
+        params: Dict[str, Any],
+        max_pages: int = GRAPH_MAX_PAGES
+    ) -> List[Dict[str, Any]]:
+        """GET an edge and follow `paging.next` for up to `max_pages` pages.
+        
+        Graph API cursors are only known once the previous page arrives, so
+        pages are fetched in sequence over the shared (HTTP/2) connection.
+        A failure on the first page propagates; a failure on a later page
+        returns the rows collected so far.
+        """
+        client = get_http_client()
+        response = await client.get(url, params=params)
+        response.raise_for_status()
+        page = orjson.loads(response.content)
+        rows = list(page.get("data", []))
+        for page_number in range(2, max_pages + 1):
+            next_url = page.get("paging", {}).get("next")
+            if not next_url:
+                return rows
+            try:
+                # The next URL already carries the access token and query
+                response = await client.get(next_url)
+                response.raise_for_status()
+                page = orjson.loads(response.content)
+            except Exception as e:
+                logger.warning(
+                    f"Facebook paging failed on page {page_number} of {url}; "
+                    f"returning {len(rows)} rows: {e}"
+                )
+                return rows
+            rows.extend(page.get("data", []))
+        if page.get("paging", {}).get("next"):
+            logger.warning(f"Facebook paging for {url} truncated at {max_pages} pages")
+        return rows
+    
     async def get_insights(
         self,
         account_id: str,
@@ -54,11 +105,7 @@ class FacebookAdsIntegration:
         }
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, params=params)
-                response.raise_for_status()
-                data = response.json()
-                return data.get("data", [])
+            return await self._get_all_pages(url, params)
         except Exception as e:
             logger.error(f"Error fetching Facebook insights: {e}")
             return []
@@ -79,10 +126,10 @@ class FacebookAdsIntegration:
         }
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(url, params=params)
-                response.raise_for_status()
-                return response.json()
+            client = get_http_client()
+            response = await client.post(url, params=params)
+            response.raise_for_status()
+            return orjson.loads(response.content)
         except Exception as e:
             logger.error(f"Error updating adset budget: {e}")
             raise
@@ -101,30 +148,49 @@ class FacebookAdsIntegration:
         
         Based on PDF example: Send high-quality conversion signals back to Meta.
         """
+        event = {
+            "event_name": event_name,
+            "event_id": event_id,
+            "event_time": int(datetime.now().timestamp()),
+            "user_data": user_data or {},
+            "custom_data": {
+                **(custom_data or {}),
+                "value": value,
+                "currency": currency.upper()
+            }
+        }
+        
+        results = await self.send_conversion_events(pixel_id, [event])
+        return results[0]
+    
+    async def send_conversion_events(
+        self,
+        pixel_id: str,
+        events: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Send many conversion events via CAPI in as few calls as possible.
+        
+        Events are split into chunks of CAPI_MAX_EVENTS_PER_REQUEST and the
+        chunks are posted concurrently. Returns one API response per chunk.
+        """
         url = f"{self.base_url}/{pixel_id}/events"
         params = {"access_token": self.access_token}
         
-        event_data = {
-            "data": [{
-                "event_name": event_name,
-                "event_id": event_id,
-                "event_time": int(datetime.now().timestamp()),
-                "user_data": user_data or {},
-                "custom_data": {
-                    **(custom_data or {}),
-                    "value": value,
-                    "currency": currency.upper()
-                }
-            }]
-        }
+        iterator = iter(events)
+        chunks = []
+        while chunk := list(islice(iterator, CAPI_MAX_EVENTS_PER_REQUEST)):
+            chunks.append(chunk)
+        
+        async def post(chunk: List[Dict[str, Any]]) -> Dict[str, Any]:
+            response = await client.post(url, params=params, json={"data": chunk})
+            response.raise_for_status()
+            return orjson.loads(response.content)
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(url, params=params, json=event_data)
-                response.raise_for_status()
-                return response.json()
+            client = get_http_client()
+            return await asyncio.gather(*(post(chunk) for chunk in chunks))
         except Exception as e:
-            logger.error(f"Error sending conversion event: {e}")
+            logger.error(f"Error sending conversion events: {e}")
             raise
     
     async def get_ad_accounts(self) -> List[Dict[str, Any]]:
@@ -136,11 +202,7 @@ class FacebookAdsIntegration:
         }
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, params=params)
-                response.raise_for_status()
-                data = response.json()
-                return data.get("data", [])
+            return await self._get_all_pages(url, params)
         except Exception as e:
             logger.error(f"Error fetching ad accounts: {e}")
             return []
@@ -158,10 +220,10 @@ class FacebookAdsIntegration:
         }
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(url, params=params)
-                response.raise_for_status()
-                return response.json()
+            client = get_http_client()
+            response = await client.post(url, params=params)
+            response.raise_for_status()
+            return orjson.loads(response.content)
         except Exception as e:
             logger.error(f"Error creating campaign: {e}")
             raise
@@ -178,11 +240,7 @@ class FacebookAdsIntegration:
         }
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, params=params)
-                response.raise_for_status()
-                data = response.json()
-                return data.get("data", [])
+            return await self._get_all_pages(url, params)
         except Exception as e:
             logger.error(f"Error fetching audiences: {e}")
             return []
@@ -216,17 +274,18 @@ class FacebookAdsIntegration:
                 "conversions": 0
             }
         
-        # Aggregate metrics
-        total_impressions = sum(int(i.get("impressions", 0)) for i in insights)
-        total_clicks = sum(int(i.get("clicks", 0)) for i in insights)
-        total_spend = sum(float(i.get("spend", 0)) for i in insights)
-        
-        # Extract conversions from actions
+        # Aggregate metrics in one pass over the insight rows
+        total_impressions = 0
+        total_clicks = 0
+        total_spend = 0.0
         total_conversions = 0
         for insight in insights:
-            actions = insight.get("actions", [])
-            for action in actions:
-                if action.get("action_type") in ["purchase", "lead", "complete_registration"]:
+            get = insight.get
+            total_impressions += int(get("impressions", 0))
+            total_clicks += int(get("clicks", 0))
+            total_spend += float(get("spend", 0))
+            for action in get("actions", ()):
+                if action.get("action_type") in CONVERSION_ACTION_TYPES:
                     total_conversions += int(action.get("value", 0))
         
         return {
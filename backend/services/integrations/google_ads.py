@@ -1,6 +1,7 @@
 """Google Ads API integration."""
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
+from functools import lru_cache
 import httpx
 import logging
 import os
@@ -10,6 +11,38 @@ from backend.config.settings import settings
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=256)
+def _compile_gaql_query(
+    dates: Optional[Tuple[str, str]],
+    campaign_id: Optional[str]
+) -> str:
+    """Render the campaign insights GAQL query; cached per date range and campaign."""
+    if dates:
+        date_filter = f"WHERE segments.date DURING '{dates[0]}' TO '{dates[1]}'"
+    else:
+        date_filter = "WHERE segments.date DURING YESTERDAY"
+    
+    campaign_filter = ""
+    if campaign_id:
+        campaign_filter = f"AND campaign.id = {campaign_id}"
+    
+    query = f"""
+    SELECT
+        campaign.id,
+        campaign.name,
+        metrics.impressions,
+        metrics.clicks,
+        metrics.cost_micros,
+        metrics.conversions,
+        metrics.conversion_value,
+        segments.date
+    FROM campaign
+    {date_filter}
+    {campaign_filter}
+    """
+    return query.strip()
+
+
 class GoogleAdsIntegration:
     """Google Ads API integration service.
     
@@ -33,33 +66,14 @@ class GoogleAdsIntegration:
         
         Based on PDF example query structure.
         """
-        date_filter = ""
         if date_range:
-            start_date = date_range.get("start_date", "YESTERDAY")
-            end_date = date_range.get("end_date", "YESTERDAY")
-            date_filter = f"WHERE segments.date DURING '{start_date}' TO '{end_date}'"
+            dates = (
+                date_range.get("start_date", "YESTERDAY"),
+                date_range.get("end_date", "YESTERDAY")
+            )
         else:
-            date_filter = "WHERE segments.date DURING YESTERDAY"
-        
-        campaign_filter = ""
-        if campaign_id:
-            campaign_filter = f"AND campaign.id = {campaign_id}"
-        
-        query = f"""
-        SELECT
-            campaign.id,
-            campaign.name,
-            metrics.impressions,
-            metrics.clicks,
-            metrics.cost_micros,
-            metrics.conversions,
-            metrics.conversion_value,
-            segments.date
-        FROM campaign
-        {date_filter}
-        {campaign_filter}
-        """
-        return query.strip()
+            dates = None
+        return _compile_gaql_query(dates, campaign_id)
     
     async def get_campaign_insights(
         self,
@@ -203,11 +217,17 @@ class GoogleAdsIntegration:
                 "cost": 0.0
             }
         
-        # Aggregate metrics
-        total_impressions = sum(int(i.get("metrics", {}).get("impressions", 0)) for i in insights)
-        total_clicks = sum(int(i.get("metrics", {}).get("clicks", 0)) for i in insights)
-        total_cost_micros = sum(int(i.get("metrics", {}).get("cost_micros", 0)) for i in insights)
-        total_conversions = sum(float(i.get("metrics", {}).get("conversions", 0)) for i in insights)
+        # Aggregate metrics in one pass over the insight rows
+        total_impressions = 0
+        total_clicks = 0
+        total_cost_micros = 0
+        total_conversions = 0.0
+        for insight in insights:
+            get = insight.get("metrics", {}).get
+            total_impressions += int(get("impressions", 0))
+            total_clicks += int(get("clicks", 0))
+            total_cost_micros += int(get("cost_micros", 0))
+            total_conversions += float(get("conversions", 0))
         
         return {
             "impressions": total_impressions,
@@ -1,8 +1,7 @@
 """LLM service for Pydantic AI integration."""
 from typing import Optional, Dict, Any
+import httpx
 from pydantic_ai import Agent
-from pydantic_ai.models.openai import OpenAIModel
-from pydantic_ai.models.anthropic import AnthropicModel
 
 from backend.config.settings import settings
 
@@ -13,24 +12,42 @@ class LLMService:
     def __init__(self):
         """Initialize LLM service."""
         self._model = None
+        self._http_client: Optional[httpx.AsyncClient] = None
         self._token_usage_cache: Dict[str, int] = {}
     
+    def get_http_client(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP client shared by all LLM calls."""
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=settings.llm_max_connections,
+                    max_keepalive_connections=settings.llm_max_keepalive_connections
+                ),
+                timeout=httpx.Timeout(timeout=600, connect=5)
+            )
+        return self._http_client
+    
     def get_model(self):
         """Get configured LLM model."""
         if self._model is None:
+            # Provider SDKs are imported on first use; each adds ~0.4-0.8s of import time
             if settings.llm_provider == "openai":
                 if not settings.openai_api_key:
                     raise ValueError("OPENAI_API_KEY not configured")
+                from pydantic_ai.models.openai import OpenAIModel
                 self._model = OpenAIModel(
                     'gpt-4-turbo-preview',
-                    api_key=settings.openai_api_key
+                    api_key=settings.openai_api_key,
+                    http_client=self.get_http_client()
                 )
             elif settings.llm_provider == "anthropic":
                 if not settings.anthropic_api_key:
                     raise ValueError("ANTHROPIC_API_KEY not configured")
+                from pydantic_ai.models.anthropic import AnthropicModel
                 self._model = AnthropicModel(
                     'claude-3-opus-20240229',
-                    api_key=settings.anthropic_api_key
+                    api_key=settings.anthropic_api_key,
+                    http_client=self.get_http_client()
                 )
             else:
                 raise ValueError(f"Unsupported LLM provider: {settings.llm_provider}")
@@ -3,7 +3,7 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 import logging
 
-from backend.agents.ad_optimization_agent import ArmState, AdOptimizationAgent
+from backend.agents.ad_optimization_agent import ARM_LIST_ADAPTER, ArmState, AdOptimizationAgent
 from backend.services.integrations.facebook_ads import FacebookAdsIntegration
 from backend.services.integrations.google_ads import GoogleAdsIntegration
 
@@ -31,7 +31,7 @@ class OptimizationService:
         Based on PDF pseudo code: fetch_arm_states(time_window)
         Returns normalized ArmState objects from both platforms.
         """
-        arms = []
+        arms: List[ArmState] = []
         
         # Fetch Facebook data
         if facebook_account_id:
@@ -44,6 +44,7 @@ class OptimizationService:
                     time_increment=1
                 )
                 
+                rows = []
                 for insight in fb_insights:
                     # Extract conversions from actions
                     conversions = 0
@@ -59,19 +60,19 @@ class OptimizationService:
                         if av.get("action_type") in ["purchase"]:
                             revenue += float(av.get("value", 0))
                     
-                    arm = ArmState(
-                        platform="facebook",
-                        id=insight.get("campaign_id", ""),
-                        campaign_id=insight.get("campaign_id"),
-                        campaign_name=insight.get("campaign_name", ""),
-                        spend=float(insight.get("spend", 0)),
-                        revenue=revenue,
-                        conversions=conversions,
-                        clicks=int(insight.get("clicks", 0)),
-                        impressions=int(insight.get("impressions", 0)),
-                        date=insight.get("date_start")
-                    )
-                    arms.append(arm)
+                    rows.append({
+                        "platform": "facebook",
+                        "id": insight.get("campaign_id", ""),
+                        "campaign_id": insight.get("campaign_id"),
+                        "campaign_name": insight.get("campaign_name", ""),
+                        "spend": float(insight.get("spend", 0)),
+                        "revenue": revenue,
+                        "conversions": conversions,
+                        "clicks": int(insight.get("clicks", 0)),
+                        "impressions": int(insight.get("impressions", 0)),
+                        "date": insight.get("date_start")
+                    })
+                arms.extend(ARM_LIST_ADAPTER.validate_python(rows))
             except Exception as e:
                 logger.error(f"Error fetching Facebook data: {e}")
         
@@ -84,23 +85,24 @@ class OptimizationService:
                     date_range=date_range
                 )
                 
+                rows = []
                 for insight in google_insights:
                     metrics = insight.get("metrics", {})
                     campaign = insight.get("campaign", {})
                     
-                    arm = ArmState(
-                        platform="google",
-                        id=str(campaign.get("id", "")),
-                        campaign_id=str(campaign.get("id", "")),
-                        campaign_name=campaign.get("name", ""),
-                        spend=metrics.get("cost_micros", 0) / 1_000_000,  # Convert micros
-                        revenue=metrics.get("conversion_value", 0.0),
-                        conversions=int(metrics.get("conversions", 0)),
-                        clicks=int(metrics.get("clicks", 0)),
-                        impressions=int(metrics.get("impressions", 0)),
-                        date=insight.get("segments", {}).get("date")
-                    )
-                    arms.append(arm)
+                    rows.append({
+                        "platform": "google",
+                        "id": str(campaign.get("id", "")),
+                        "campaign_id": str(campaign.get("id", "")),
+                        "campaign_name": campaign.get("name", ""),
+                        "spend": metrics.get("cost_micros", 0) / 1_000_000,  # Convert micros
+                        "revenue": metrics.get("conversion_value", 0.0),
+                        "conversions": int(metrics.get("conversions", 0)),
+                        "clicks": int(metrics.get("clicks", 0)),
+                        "impressions": int(metrics.get("impressions", 0)),
+                        "date": insight.get("segments", {}).get("date")
+                    })
+                arms.extend(ARM_LIST_ADAPTER.validate_python(rows))
             except Exception as e:
                 logger.error(f"Error fetching Google Ads data: {e}")
         
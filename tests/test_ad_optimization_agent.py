@@ -0,0 +1,120 @@
+"""Tests for ad optimization agent."""
+import pytest
+
+from backend.agents.ad_optimization_agent import (
+    AdOptimizationAgent,
+    ArmMetrics,
+    ArmState,
+    BudgetAllocationRequest
+)
+
+
+def make_arms():
+    """Build a mix of arms covering every scoring branch."""
+    return [
+        ArmState(platform="facebook", id="fb_1", spend=1000.0, revenue=4000.0,
+                 conversions=40, impressions=50000, profit_margin=0.3, ltv=150.0,
+                 current_daily_budget=100.0),
+        ArmState(platform="google", id="g_1", spend=800.0, revenue=1200.0,
+                 conversions=25, impressions=20000, inventory_status="low_stock",
+                 audience_quality_score=0.8, current_daily_budget=80.0),
+        ArmState(platform="facebook", id="fb_2", spend=200.0, revenue=100.0,
+                 conversions=3, impressions=4000, current_daily_budget=20.0),
+        ArmState(platform="google", id="g_2", spend=0.0, revenue=0.0,
+                 conversions=0, impressions=0),
+        ArmState(platform="google", id="g_3", spend=500.0, revenue=3000.0,
+                 conversions=15, impressions=9000, inventory_status="out_of_stock",
+                 current_daily_budget=50.0),
+    ]
+
+
+@pytest.mark.parametrize("goal", ["roas", "profit", "ltv", "cpa"])
+def test_vectorized_scores_match_score_arm(goal):
+    """Vectorized scoring matches the per-arm scoring rules."""
+    agent = AdOptimizationAgent()
+    arms = make_arms()
+    
+    scores = agent._score_arms_vectorized(
+        [ArmMetrics.from_state(arm) for arm in arms], 10, goal
+    )
+    
+    expected = [agent.score_arm(arm, 10, goal) for arm in arms]
+    assert list(scores) == pytest.approx(expected)
+
+
+@pytest.mark.asyncio
+async def test_fallback_allocation_respects_max_change_ratio():
+    """Fallback allocation never moves a budget by more than max_change_ratio."""
+    agent = AdOptimizationAgent()
+    request = BudgetAllocationRequest(
+        arms=make_arms(),
+        total_budget=250.0,
+        max_change_ratio=0.3,
+        strategy="intelligent"
+    )
+    
+    response = await agent._allocate_budget_fallback(request)
+    
+    assert [a.arm_id for a in response.allocations] == [arm.id for arm in request.arms]
+    for allocation in response.allocations:
+        max_change = allocation.current_budget * 0.3
+        assert abs(allocation.new_budget - allocation.current_budget) <= max_change + 1e-9
+        assert allocation.new_budget >= 0
+    assert response.total_allocated == pytest.approx(
+        sum(a.new_budget for a in response.allocations)
+    )
+
+
+@pytest.mark.asyncio
+async def test_fallback_allocation_equal_split_without_scores():
+    """Arms without any score share the budget equally."""
+    agent = AdOptimizationAgent()
+    request = BudgetAllocationRequest(
+        arms=[
+            ArmState(platform="facebook", id="a", spend=100.0, conversions=20, impressions=2000),
+            ArmState(platform="google", id="b", spend=100.0, conversions=20, impressions=2000),
+        ],
+        total_budget=100.0
+    )
+    
+    response = await agent._allocate_budget_fallback(request)
+    
+    assert [a.new_budget for a in response.allocations] == [50.0, 50.0]
+    assert all(a.score == 0.0 for a in response.allocations)
+
+
+@pytest.mark.parametrize("goal", ["roas", "profit", "ltv", "cpa"])
+def test_score_arm_zero_spend_scores_zero(goal):
+    """Arms with conversions but no spend score 0 for every goal."""
+    agent = AdOptimizationAgent()
+    arm = ArmState(
+        id="free", platform="google", spend=0.0, revenue=500.0,
+        conversions=20, impressions=1000, ltv=90.0, profit_margin=0.4
+    )
+
+    assert agent.score_arm(arm, 10, goal) == 0.0
+
+
+def test_arm_state_is_frozen_with_precomputed_metrics():
+    """ArmState metrics are computed at construction and fields are immutable."""
+    from pydantic import ValidationError
+
+    arm = ArmState(platform="google", id="g", spend=100.0, revenue=300.0,
+                   conversions=4, ltv=50.0)
+
+    assert arm.roas == 3.0
+    assert arm.cpa == 25.0
+    assert arm.profit_roas == pytest.approx(-0.4)
+    assert arm.ltv_roas == 2.0
+    with pytest.raises(ValidationError):
+        arm.spend = 10.0
+
+
+def test_arm_metrics_copies_arm_state_metrics():
+    """ArmMetrics reuses ArmState's precomputed values rather than its own formulas."""
+    for arm in make_arms():
+        metrics = ArmMetrics.from_state(arm)
+        assert (metrics.roas, metrics.cpa, metrics.profit_roas, metrics.ltv_roas) == (
+            arm.roas, arm.cpa, arm.profit_roas, arm.ltv_roas
+        )
+        assert metrics.inventory_code == arm.inventory_code
@@ -0,0 +1,77 @@
+"""Tests for the agent response cache."""
+import pytest
+from pydantic import BaseModel
+
+from backend.agents._cache import cached_async
+
+
+class EchoRequest(BaseModel):
+    """Test request model."""
+    message: str
+
+
+class EchoResponse(BaseModel):
+    """Test response model."""
+    response: str
+
+
+class Echo:
+    """Counts calls to its cached method."""
+
+    def __init__(self):
+        self.calls = 0
+
+    @cached_async(maxsize=2)
+    async def run(self, request: EchoRequest) -> EchoResponse:
+        self.calls += 1
+        return EchoResponse(response=request.message)
+
+
+@pytest.mark.asyncio
+async def test_cached_async_hits_and_evicts():
+    """Identical requests hit the cache; the least recently used entry is evicted."""
+    Echo.run.cache_clear()
+    echo = Echo()
+
+    await echo.run(EchoRequest(message="a"))
+    await echo.run(EchoRequest(message="a"))
+    assert echo.calls == 1
+
+    await echo.run(EchoRequest(message="b"))
+    await echo.run(EchoRequest(message="c"))  # evicts "a"
+    await echo.run(EchoRequest(message="a"))
+    assert echo.calls == 4
+
+
+@pytest.mark.asyncio
+async def test_cached_async_skips_large_entries():
+    """Responses over max_entry_bytes are returned but not stored."""
+    calls = []
+
+    @cached_async(max_entry_bytes=10)
+    async def run(self, request):
+        calls.append(1)
+        return EchoResponse(response=request.message)
+
+    await run(None, EchoRequest(message="much too long to cache"))
+    await run(None, EchoRequest(message="much too long to cache"))
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_cached_async_coalesces_concurrent_misses():
+    """Concurrent identical misses share one call to the wrapped method."""
+    import asyncio
+
+    calls = []
+
+    @cached_async()
+    async def run(self, request):
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return EchoResponse(response=request.message)
+
+    results = await asyncio.gather(*[run(None, EchoRequest(message="same")) for _ in range(3)])
+
+    assert len(calls) == 1
+    assert [r.response for r in results] == ["same", "same", "same"]
@@ -26,3 +26,162 @@ def test_agent_status():
     response = client.get("/api/v1/agents/status")
     assert response.status_code == 200
     assert "seo_agent" in response.json()
+
+
+
+@pytest.fixture
+def task_db():
+    """Point the API at an in-memory SQLite database."""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import StaticPool
+
+    from backend.models.database import Base, get_db
+
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    TestSession = sessionmaker(bind=engine)
+
+    def override_get_db():
+        db = TestSession()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    yield TestSession
+    app.dependency_overrides.pop(get_db)
+
+
+def test_get_tasks_pages_with_cursor(task_db):
+    """Task listing walks newest-first pages via next_cursor."""
+    from backend.models.schemas import Task
+
+    with task_db() as db:
+        db.add_all([Task(agent_type="seo", status="pending") for _ in range(5)])
+        db.commit()
+
+    first = client.get("/api/v1/tasks/", params={"limit": 3}).json()
+    second = client.get(
+        "/api/v1/tasks/", params={"limit": 3, "cursor": first["next_cursor"]}
+    ).json()
+
+    assert [task["id"] for task in first["items"]] == [5, 4, 3]
+    assert first["next_cursor"] == 3
+    assert [task["id"] for task in second["items"]] == [2, 1]
+    assert second["next_cursor"] is None
+
+
+def test_get_tasks_rejects_out_of_range_limit(task_db):
+    """Page sizes outside 1..500 are a validation error, not a 500."""
+    assert client.get("/api/v1/tasks/", params={"limit": 0}).status_code == 422
+    assert client.get("/api/v1/tasks/", params={"limit": 501}).status_code == 422
+
+
+def test_update_task(task_db):
+    """Updating a task returns the new state; unknown ids are 404."""
+    from backend.models.schemas import Task
+
+    with task_db() as db:
+        db.add(Task(agent_type="seo", status="pending"))
+        db.commit()
+
+    response = client.patch("/api/v1/tasks/1", params={"status": "completed"})
+    missing = client.patch("/api/v1/tasks/99", params={"status": "completed"})
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "completed"
+    assert response.json()["completed_at"] is not None
+    assert client.get("/api/v1/tasks/1").json()["status"] == "completed"
+    assert missing.status_code == 404
+
+
+def test_agent_route_errors_become_500_with_message(monkeypatch):
+    """Agent failures surface as a 500 carrying the error message."""
+    from backend.api.routes import agents
+
+    async def fail(request):
+        raise RuntimeError("upstream unavailable")
+
+    monkeypatch.setattr(agents.seo_agent, "analyze_seo", fail)
+    response = client.post(
+        "/api/v1/agents/seo/analyze",
+        json={"keyword": "shoes", "url": "https://example.com"}
+    )
+
+    assert response.status_code == 500
+    assert response.json() == {"detail": "upstream unavailable"}
+
+
+def test_agent_route_converts_agent_error_to_500(monkeypatch):
+    """A failed agent run is reported as a 500 like any other handler error."""
+    from backend.agents.base_agent import AgentError
+    from backend.api.routes import agents
+
+    async def fail(request):
+        raise AgentError("seo agent failed: timeout")
+
+    monkeypatch.setattr(agents.seo_agent, "analyze_seo", fail)
+    response = client.post(
+        "/api/v1/agents/seo/analyze",
+        json={"keyword": "shoes", "url": "https://example.com"}
+    )
+
+    assert response.status_code == 500
+    assert response.json() == {"detail": "seo agent failed: timeout"}
+
+
+def test_create_tasks(task_db):
+    """Single and batch task creation return the generated rows."""
+    single = client.post("/api/v1/tasks/", json={"agent_type": "seo", "client_id": None})
+    batch = client.post(
+        "/api/v1/tasks/batch",
+        json=[{"agent_type": "content"}, {"agent_type": "social", "input_data": {"x": 1}}]
+    )
+
+    assert single.status_code == 200
+    assert single.json()["id"] == 1
+    assert single.json()["status"] == "pending"
+    assert batch.status_code == 200
+    assert [(t["id"], t["agent_type"]) for t in batch.json()] == [(2, "content"), (3, "social")]
+    assert batch.json()[1]["input_data"] == {"x": 1}
+    assert batch.json()[0]["created_at"] is not None
+
+
+def test_update_task_without_fields_touches_updated_at(task_db):
+    """A bare PATCH still bumps updated_at from the database clock."""
+    from backend.models.schemas import Task
+
+    with task_db() as db:
+        db.add(Task(agent_type="seo", status="pending"))
+        db.commit()
+
+    response = client.patch("/api/v1/tasks/1")
+
+    assert response.status_code == 200
+    assert response.json()["updated_at"] is not None
+    assert response.json()["completed_at"] is None
+
+
+def test_lifespan_queues_logging_through_configured_handlers(monkeypatch):
+    """Startup moves root handlers behind a queue; shutdown restores them."""
+    import logging
+    from logging.handlers import QueueHandler
+
+    from pydantic_ai.models.test import TestModel
+
+    from backend.services.llm_service import llm_service
+
+    monkeypatch.setattr(llm_service, "get_model", lambda: TestModel())
+    root = logging.getLogger()
+    configured = list(root.handlers)
+
+    with TestClient(app):
+        assert [type(h) for h in root.handlers] == [QueueHandler]
+
+    assert root.handlers == configured
@@ -15,6 +15,16 @@ class TestResponse(BaseModel):
     response: str
 
 
+@pytest.fixture
+def offline_model(monkeypatch):
+    """Build agents on pydantic-ai's TestModel instead of a real provider."""
+    from pydantic_ai.models.test import TestModel
+
+    from backend.services.llm_service import llm_service
+
+    monkeypatch.setattr(llm_service, "get_model", lambda: TestModel())
+
+
 @pytest.mark.asyncio
 async def test_base_agent_initialization():
     """Test base agent initialization."""
@@ -32,6 +42,21 @@ async def test_base_agent_initialization():
     assert agent._initialized
 
 
+def test_base_agent_initialize_is_idempotent(offline_model):
+    """Repeated initialization reuses the first LLM agent."""
+    agent = BaseAgent(
+        agent_type="test",
+        system_prompt="You are a test agent.",
+        request_type=TestRequest,
+        response_type=TestResponse
+    )
+    
+    first = agent.agent
+    agent.initialize()
+    
+    assert agent.agent is first
+
+
 @pytest.mark.asyncio
 async def test_base_agent_status():
     """Test agent status."""
@@ -45,3 +70,310 @@ async def test_base_agent_status():
     status = agent.get_status()
     assert status["agent_type"] == "test"
     assert status["initialized"] == False
+
+
+@pytest.mark.asyncio
+async def test_batching_agent_demuxes_concurrent_requests(offline_model):
+    """Concurrent requests share one LLM call and get their own results."""
+    import asyncio
+    import json
+    from pydantic_ai import Agent
+    from pydantic_ai.messages import ModelResponse, ToolCallPart
+    from pydantic_ai.models.function import FunctionModel
+
+    from backend.agents.base_agent import BatchingAgent
+
+    calls = []
+
+    def respond(messages, info):
+        prompt = messages[-1].parts[-1].content
+        payload = json.loads(prompt[prompt.index("["):])
+        calls.append(len(payload))
+        items = [
+            {"id": item["id"], "result": {"response": item["request"]["message"].upper()}}
+            for item in payload
+        ]
+        return ModelResponse(parts=[
+            ToolCallPart.from_raw_args(info.result_tools[0].name, {"items": items})
+        ])
+
+    batcher = BatchingAgent(
+        BaseAgent(
+            agent_type="test",
+            system_prompt="You are a test agent.",
+            request_type=TestRequest,
+            response_type=TestResponse
+        ),
+        batch_size=4
+    )
+    batcher.batch_agent  # build the batch result type
+    batcher._batch_agent = Agent(FunctionModel(respond), result_type=batcher._batch_result_type)
+
+    results = await asyncio.gather(*[
+        batcher.execute({"message": f"m{i}"}) for i in range(4)
+    ])
+
+    assert calls == [4]
+    assert [r.response for r in results] == ["M0", "M1", "M2", "M3"]
+
+
+@pytest.mark.asyncio
+async def test_batching_agent_retries_only_missing_ids(offline_model):
+    """Ids the batch response omits are re-run alone; the rest keep their batch result."""
+    import asyncio
+    import json
+    from pydantic_ai import Agent
+    from pydantic_ai.messages import ModelResponse, ToolCallPart
+    from pydantic_ai.models.function import FunctionModel
+
+    from backend.agents.base_agent import BatchingAgent
+
+    single_calls = []
+
+    def respond_batch(messages, info):
+        prompt = messages[-1].parts[-1].content
+        payload = json.loads(prompt[prompt.index("["):])
+        items = [
+            {"id": item["id"], "result": {"response": item["request"]["message"].upper()}}
+            for item in payload
+            if item["request"]["message"] != "m2"
+        ]
+        return ModelResponse(parts=[
+            ToolCallPart.from_raw_args(info.result_tools[0].name, {"items": items})
+        ])
+
+    def respond_single(messages, info):
+        single_calls.append(messages[-1].parts[-1].content)
+        return ModelResponse(parts=[
+            ToolCallPart.from_raw_args(info.result_tools[0].name, {"response": "retried"})
+        ])
+
+    base = BaseAgent(
+        agent_type="test",
+        system_prompt="You are a test agent.",
+        request_type=TestRequest,
+        response_type=TestResponse
+    )
+    base._agent = Agent(FunctionModel(respond_single), result_type=TestResponse)
+    batcher = BatchingAgent(base, batch_size=4)
+    batcher.batch_agent  # build the batch result type
+    batcher._batch_agent = Agent(FunctionModel(respond_batch), result_type=batcher._batch_result_type)
+
+    results = await asyncio.gather(*[
+        batcher.execute({"message": f"m{i}"}) for i in range(4)
+    ])
+
+    assert len(single_calls) == 1
+    assert [r.response for r in results] == ["M0", "M1", "retried", "M3"]
+
+
+@pytest.mark.asyncio
+async def test_batching_agent_overlaps_batches():
+    """A slow batch does not hold up the batches queued behind it."""
+    import asyncio
+    from pydantic_ai import Agent
+    from pydantic_ai.messages import ModelResponse, ToolCallPart
+    from pydantic_ai.models.function import FunctionModel
+
+    from backend.agents.base_agent import BatchingAgent
+
+    running = []
+    peak = []
+
+    async def respond(messages, info):
+        running.append(1)
+        peak.append(len(running))
+        await asyncio.sleep(0.02)
+        running.pop()
+        return ModelResponse(parts=[
+            ToolCallPart.from_raw_args(info.result_tools[0].name, {"response": "ok"})
+        ])
+
+    base = BaseAgent(
+        agent_type="test",
+        system_prompt="You are a test agent.",
+        request_type=TestRequest,
+        response_type=TestResponse
+    )
+    base._agent = Agent(FunctionModel(respond), result_type=TestResponse)
+    batcher = BatchingAgent(base, batch_size=1)
+
+    results = await asyncio.gather(*[
+        batcher.execute({"message": f"m{i}"}) for i in range(3)
+    ])
+    await batcher.close()
+
+    assert [r.response for r in results] == ["ok", "ok", "ok"]
+    assert max(peak) == 3
+    assert not batcher._dispatches
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_requests_share_one_run():
+    """Duplicate in-flight requests await the same agent run."""
+    import asyncio
+    from pydantic_ai import Agent
+    from pydantic_ai.messages import ModelResponse, ToolCallPart
+    from pydantic_ai.models.function import FunctionModel
+
+    calls = []
+
+    async def respond(messages, info):
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return ModelResponse(parts=[
+            ToolCallPart.from_raw_args(info.result_tools[0].name, {"response": "ok"})
+        ])
+
+    agent = BaseAgent(
+        agent_type="test",
+        system_prompt="You are a test agent.",
+        request_type=TestRequest,
+        response_type=TestResponse
+    )
+    agent._agent = Agent(FunctionModel(respond), result_type=TestResponse)
+
+    results = await asyncio.gather(
+        agent.execute({"message": "same"}),
+        agent.execute(TestRequest(message="same")),
+        agent.execute({"message": "other"})
+    )
+
+    assert len(calls) == 2
+    assert [r.response for r in results] == ["ok", "ok", "ok"]
+    assert agent._inflight == {}
+
+
+def test_registry_shares_agents_across_wrappers():
+    """Wrapper instances reuse the same BaseAgent per agent type."""
+    from backend.agents.campaign_agent import CampaignAgent
+
+    first, second = CampaignAgent(), CampaignAgent()
+
+    assert first.creation_agent is second.creation_agent
+    assert first.abtest_agent is not first.creation_agent
+
+
+@pytest.mark.asyncio
+async def test_wrapper_bulk_rejects_unknown_operation():
+    """bulk() validates operation names before dispatching anything."""
+    from backend.agents.content_agent import ContentAgent
+
+    with pytest.raises(ValueError):
+        await ContentAgent().bulk([("delete_everything", TestRequest(message="x"))])
+
+
+@pytest.mark.asyncio
+async def test_bulk_dispatch_bounds_concurrency():
+    """bulk() keeps request order and never exceeds bulk_concurrency."""
+    import asyncio
+
+    from backend.agents.base_agent import BulkDispatchMixin
+
+    running = []
+    peak = []
+
+    class Echo(BulkDispatchMixin):
+        bulk_concurrency = 2
+
+        def __init__(self):
+            self._operations = {"echo": self.echo}
+
+        async def echo(self, request):
+            running.append(1)
+            peak.append(len(running))
+            await asyncio.sleep(0.01)
+            running.pop()
+            return request.message
+
+    results = await Echo().bulk([("echo", TestRequest(message=str(i))) for i in range(5)])
+
+    assert results == ["0", "1", "2", "3", "4"]
+    assert max(peak) == 2
+
+
+@pytest.mark.asyncio
+async def test_stream_field_yields_deltas_then_result():
+    """stream_field emits text deltas that add up to the final field value."""
+    from pydantic_ai import Agent
+    from pydantic_ai.models.function import FunctionModel, DeltaToolCall
+
+    async def stream_fn(messages, info):
+        yield {0: DeltaToolCall(name=info.result_tools[0].name)}
+        for chunk in ['{"response": "Hel', 'lo, wor', 'ld"}']:
+            yield {0: DeltaToolCall(json_args=chunk)}
+
+    agent = BaseAgent(
+        agent_type="test",
+        system_prompt="You are a test agent.",
+        request_type=TestRequest,
+        response_type=TestResponse
+    )
+    agent._agent = Agent(FunctionModel(stream_function=stream_fn), result_type=TestResponse)
+
+    events = [e async for e in agent.stream_field({"message": "hi"}, "response")]
+
+    deltas = "".join(value for event, value in events if event == "delta")
+    assert deltas == "Hello, world"
+    assert events[-1][0] == "result"
+    assert events[-1][1].response == "Hello, world"
+
+
+def test_system_prompt_is_normalized_once():
+    """Source indentation is removed from system prompts at construction."""
+    agent = BaseAgent(
+        agent_type="test",
+        system_prompt="""You are a test agent. 
+            Keep answers short.  """,
+        request_type=TestRequest,
+        response_type=TestResponse
+    )
+
+    assert agent.system_prompt == "You are a test agent.\nKeep answers short."
+
+
+@pytest.mark.asyncio
+async def test_wrapper_handle_rejects_unknown_request_type():
+    """handle() only dispatches request types the wrapper owns."""
+    from backend.agents.campaign_agent import CampaignAgent
+
+    with pytest.raises(TypeError):
+        await CampaignAgent().handle(TestRequest(message="x"))
+
+
+@pytest.mark.asyncio
+async def test_gather_bounded_limits_concurrency_and_keeps_order():
+    """gather_bounded never exceeds its limit and returns results in order."""
+    import asyncio
+
+    from backend.agents.base_agent import gather_bounded
+
+    running = 0
+    peak = 0
+
+    async def handler(value):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01 * (5 - value))
+        running -= 1
+        return value * 2
+
+    results = await gather_bounded(handler, range(5), concurrency=2)
+
+    assert results == [0, 2, 4, 6, 8]
+    assert peak == 2
+
+
+def test_dump_json_handles_decimals_and_int_keys():
+    """Request serialization accepts values that plain orjson rejects."""
+    from decimal import Decimal
+    from typing import Dict
+
+    class PricedRequest(BaseModel):
+        price: Decimal
+        counts: Dict[int, int]
+
+    dumped = BaseAgent._dump_json(PricedRequest(price=Decimal("9.99"), counts={1: 2}))
+
+    assert dumped == b'{"price":"9.99","counts":{"1":2}}'
@@ -0,0 +1,38 @@
+"""Tests for campaign agent request models."""
+import pytest
+from pydantic import ValidationError
+
+from backend.agents.campaign_agent import CampaignOptimizationRequest, CampaignRequest
+
+
+def _campaign(target_audience):
+    return CampaignRequest(
+        campaign_type="social",
+        budget=1000,
+        target_audience=target_audience,
+        objectives=["leads"],
+        channels=["facebook"]
+    )
+
+
+def test_campaign_request_validates_audience_fields():
+    """Declared audience fields are coerced; malformed ones are rejected."""
+    typed = _campaign({"age_range": [25, 45], "geos": ["US"], "lookalike": True})
+    assert typed.target_audience.age_range == (25, 45)
+    assert typed.target_audience.model_dump()["lookalike"] is True
+
+    for audience in [{"age_range": "25-45"}, {"geos": "US"}]:
+        with pytest.raises(ValidationError):
+            _campaign(audience)
+
+
+def test_optimization_request_rejects_formatted_metrics():
+    """Metrics must be numeric; strings such as "2.1%" are a validation error."""
+    request = CampaignOptimizationRequest(
+        campaign_id="c1",
+        performance_data={"ctr": 0.021, "clicks": "120"}
+    )
+    assert request.performance_data.clicks == 120
+
+    with pytest.raises(ValidationError):
+        CampaignOptimizationRequest(campaign_id="c1", performance_data={"ctr": "2.1%"})
@@ -0,0 +1,19 @@
+"""Tests for client communication agent request models."""
+import pytest
+from pydantic import ValidationError
+
+from backend.agents.client_communication_agent import ClientUpdateRequest
+
+
+def test_update_request_requires_numeric_metrics():
+    """Metric values must be numbers; nested or formatted values are rejected."""
+    request = ClientUpdateRequest(
+        client_id=1,
+        update_type="performance",
+        data={"metrics": {"ctr": 0.021}}
+    )
+    assert request.data.metrics == {"ctr": 0.021}
+
+    for metrics in [{"ctr": "2.1%"}, {"by_channel": {"search": 1.2}}]:
+        with pytest.raises(ValidationError):
+            ClientUpdateRequest(client_id=1, update_type="performance", data={"metrics": metrics})
@@ -0,0 +1,43 @@
+"""Tests for content agent."""
+import pytest
+from pydantic import ValidationError
+
+from backend.agents.content_agent import MAX_CALENDAR_DATES, ContentCalendarRequest, build_date_grid
+
+
+def test_build_date_grid_weekly():
+    """Weekly grid includes both ends when they align."""
+    assert build_date_grid("2024-01-01", "2024-01-22", "weekly") == [
+        "2024-01-01", "2024-01-08", "2024-01-15", "2024-01-22"
+    ]
+
+
+def test_build_date_grid_monthly_clips_to_month_end():
+    """Monthly grid keeps the start day, clipped to shorter months."""
+    assert build_date_grid("2024-01-31", "2024-04-30", "monthly") == [
+        "2024-01-31", "2024-02-29", "2024-03-31", "2024-04-30"
+    ]
+
+
+def test_build_date_grid_unknown_input():
+    """Unknown frequency or bad dates leave enumeration to the LLM."""
+    assert build_date_grid("2024-01-01", "2024-02-01", "hourly") == []
+    assert build_date_grid("soon", "later", "daily") == []
+
+
+def test_build_date_grid_rejects_bad_ranges():
+    """Reversed ranges and grids past the cap raise instead of expanding."""
+    with pytest.raises(ValueError):
+        build_date_grid("2024-02-01", "2024-01-01", "daily")
+    with pytest.raises(ValueError):
+        build_date_grid("2000-01-01", "2030-12-31", "daily")
+    assert len(build_date_grid("2024-01-01", "2024-12-31", "daily")) == MAX_CALENDAR_DATES
+
+
+def test_calendar_request_expands_and_validates_dates():
+    """Requests get their date grid on validation; oversized ranges are rejected."""
+    request = ContentCalendarRequest(start_date="2024-01-01", end_date="2024-01-15", frequency="weekly")
+    assert request.dates == ["2024-01-01", "2024-01-08", "2024-01-15"]
+
+    with pytest.raises(ValidationError):
+        ContentCalendarRequest(start_date="2000-01-01", end_date="2030-12-31", frequency="daily")
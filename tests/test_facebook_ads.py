@@ -0,0 +1,115 @@
+"""Tests for Facebook Ads integration."""
+import json
+
+import httpx
+import pytest
+
+from backend.services.integrations import facebook_ads
+from backend.services.integrations.facebook_ads import FacebookAdsIntegration
+
+
+@pytest.mark.asyncio
+async def test_get_insights_follows_paging(monkeypatch):
+    """Insights from every page are returned, in order."""
+    pages = {
+        None: {
+            "data": [{"campaign_id": "a"}],
+            "paging": {"next": "https://graph.facebook.com/v19.0/act_1/insights?after=x"}
+        },
+        "x": {"data": [{"campaign_id": "b"}], "paging": {}},
+    }
+
+    def handler(request):
+        return httpx.Response(200, json=pages[request.url.params.get("after")])
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(facebook_ads, "get_http_client", lambda: client)
+
+    insights = await FacebookAdsIntegration().get_insights("act_1")
+
+    assert [row["campaign_id"] for row in insights] == ["a", "b"]
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_get_insights_keeps_earlier_pages_when_later_page_fails(monkeypatch):
+    """A failing later page returns the rows already collected."""
+    def handler(request):
+        if request.url.params.get("after") == "x":
+            return httpx.Response(500)
+        return httpx.Response(200, json={
+            "data": [{"campaign_id": "a"}],
+            "paging": {"next": "https://graph.facebook.com/v19.0/act_1/insights?after=x"}
+        })
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(facebook_ads, "get_http_client", lambda: client)
+
+    insights = await FacebookAdsIntegration().get_insights("act_1")
+
+    assert [row["campaign_id"] for row in insights] == ["a"]
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_get_all_pages_stops_at_max_pages(monkeypatch):
+    """Paging stops after max_pages even if the API keeps returning cursors."""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        n = len(requests)
+        return httpx.Response(200, json={
+            "data": [{"page": n}],
+            "paging": {"next": f"https://graph.facebook.com/v19.0/act_1/insights?after={n}"}
+        })
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(facebook_ads, "get_http_client", lambda: client)
+
+    rows = await FacebookAdsIntegration()._get_all_pages(
+        "https://graph.facebook.com/v19.0/act_1/insights", {}, max_pages=3
+    )
+
+    assert [row["page"] for row in rows] == [1, 2, 3]
+    assert len(requests) == 3
+    await client.aclose()
+
+@pytest.mark.asyncio
+async def test_get_ad_performance_aggregates_insights(monkeypatch):
+    """Performance totals sum every row and count only conversion actions."""
+    async def get_insights(self, **kwargs):
+        return [
+            {"impressions": "100", "clicks": "5", "spend": "12.5",
+             "actions": [{"action_type": "purchase", "value": "2"},
+                         {"action_type": "link_click", "value": "5"}]},
+            {"impressions": "50", "clicks": "1", "spend": "2.5",
+             "actions": [{"action_type": "lead", "value": "1"}]},
+        ]
+
+    monkeypatch.setattr(FacebookAdsIntegration, "get_insights", get_insights)
+
+    performance = await FacebookAdsIntegration().get_ad_performance("1")
+
+    assert performance == {"impressions": 150, "clicks": 6, "spend": 15.0, "conversions": 3}
+
+
+@pytest.mark.asyncio
+async def test_send_conversion_events_batches_per_request_limit(monkeypatch):
+    """Events are posted in chunks no larger than the CAPI limit."""
+    batch_sizes = []
+
+    def handler(request):
+        batch = json.loads(request.content)["data"]
+        batch_sizes.append(len(batch))
+        return httpx.Response(200, json={"events_received": len(batch)})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(facebook_ads, "get_http_client", lambda: client)
+    events = [{"event_name": "Purchase", "event_id": str(i)} for i in range(2500)]
+
+    results = await FacebookAdsIntegration().send_conversion_events("123", events)
+
+    assert sorted(batch_sizes) == [500, 1000, 1000]
+    assert [result["events_received"] for result in results] == [1000, 1000, 500]
+    await client.aclose()
@@ -0,0 +1,19 @@
+"""Tests for the shared HTTP client."""
+import httpx
+import pytest
+
+from backend.services import http_client
+
+
+@pytest.mark.asyncio
+async def test_get_http_client_builds_and_reuses_client(monkeypatch):
+    """The client builds whether or not h2 is installed, and is shared until closed."""
+    monkeypatch.setattr(http_client, "_client", None)
+
+    client = http_client.get_http_client()
+
+    assert isinstance(client, httpx.AsyncClient)
+    assert http_client.get_http_client() is client
+    await http_client.close_http_client()
+    assert http_client._client is None
+
@@ -0,0 +1,92 @@
+"""Tests for the Redis response cache middleware."""
+import pytest
+from fastapi.testclient import TestClient
+from starlette.requests import Request
+
+from backend.api import response_cache
+from backend.api.main import app
+
+CACHED_PATH = "/api/v1/agents/ad-optimization/fetch-arms"
+
+
+class FakeRedis:
+    """Records lock traffic; serves a preset entry from hgetall."""
+
+    def __init__(self, entry=None, lock_free=True):
+        self.entry = entry or {}
+        self.lock_free = lock_free
+        self.released = []
+
+    async def hgetall(self, key):
+        return self.entry
+
+    async def set(self, key, value, nx=False, ex=None):
+        return self.lock_free
+
+    async def eval(self, script, numkeys, key, token):
+        self.released.append(key)
+
+
+def make_request(method="GET", path=CACHED_PATH):
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    scope = {
+        "type": "http", "method": method, "path": path,
+        "query_string": b"", "headers": [],
+    }
+    return Request(scope, receive)
+
+
+def test_cache_hit_carries_cors_headers(monkeypatch):
+    """Cached hits are served inside CORS, so browsers can read them."""
+    fake = FakeRedis({b"body": b"[]", b"status": b"200"})
+    monkeypatch.setattr(response_cache, "_get_client", lambda: fake)
+
+    response = TestClient(app).get(CACHED_PATH, headers={"Origin": "http://localhost:3000"})
+
+    assert response.headers["X-Cache"] == "HIT"
+    assert response.headers["access-control-allow-origin"] == "http://localhost:3000"
+
+
+@pytest.mark.asyncio
+async def test_preflight_bypasses_cache(monkeypatch):
+    """OPTIONS requests never touch Redis."""
+    monkeypatch.setattr(response_cache, "_get_client", pytest.fail)
+
+    async def call_next(request):
+        return "handled"
+
+    assert await response_cache.cache_responses(make_request("OPTIONS"), call_next) == "handled"
+
+
+@pytest.mark.asyncio
+async def test_fill_lock_released_when_handler_raises(monkeypatch):
+    """A failing handler does not leave its key locked."""
+    fake = FakeRedis()
+    monkeypatch.setattr(response_cache, "_get_client", lambda: fake)
+
+    async def call_next(request):
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        await response_cache.cache_responses(make_request(), call_next)
+
+    assert len(fake.released) == 1
+    assert fake.released[0].endswith(":lock")
+
+
+@pytest.mark.asyncio
+async def test_waiter_does_not_release_lock_it_never_held(monkeypatch):
+    """A request that times out waiting on another's fill lock leaves it alone."""
+    fake = FakeRedis(lock_free=False)
+    monkeypatch.setattr(response_cache, "_get_client", lambda: fake)
+    monkeypatch.setattr(response_cache, "LOCK_WAIT_SECONDS", 0.0)
+
+    async def call_next(request):
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        await response_cache.cache_responses(make_request(), call_next)
+
+    assert fake.released == []
@@ -0,0 +1,63 @@
+"""Tests for ROI audit agent."""
+import pytest
+
+from backend.agents.ad_optimization_agent import ArmState
+from backend.agents.roi_audit_agent import ROIAuditAgent, ROIAuditRequest
+
+
+def make_arms():
+    """Build arms that trip each per-arm audit rule."""
+    return [
+        ArmState(platform="facebook", id="fb_1", spend=300.0, revenue=0.0,
+                 conversions=0, impressions=10000),
+        ArmState(platform="google", id="g_1", spend=200.0, revenue=150.0,
+                 conversions=3, impressions=5000, ltv=90.0),
+        ArmState(platform="facebook", id="fb_2", spend=900.0, revenue=300.0,
+                 conversions=30, impressions=40000, profit_margin=0.2),
+        ArmState(platform="google", id="g_2", spend=50.0, revenue=400.0,
+                 conversions=12, impressions=3000, inventory_status="out_of_stock"),
+        ArmState(platform="google", id="g_3", spend=0.0, revenue=0.0,
+                 conversions=0, impressions=0, ltv=40.0),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_audit_fallback_flags_each_rule():
+    """Fallback audit reports each rule against the right arms."""
+    request = ROIAuditRequest(arms=make_arms(), account_id="acct", optimization_goal="ltv")
+    
+    response = await ROIAuditAgent()._audit_fallback(request)
+    
+    tracking = {(i.issue_type, i.affected_arms[0]) for i in response.tracking_issues}
+    assert tracking == {("missing_conversions", "fb_1"), ("low_conversion_volume", "g_1")}
+    config = {(i.issue_type, i.description.split()[1]) for i in response.configuration_issues}
+    assert config == {
+        ("negative_roas", "fb_2"),
+        ("missing_ltv_data", "fb_1"),
+        ("missing_ltv_data", "fb_2"),
+        ("missing_ltv_data", "g_2"),
+        ("out_of_stock_campaign", "g_2"),
+    }
+    assert response.critical_issues_count == 1
+    # 1 critical, 3 high, 3 medium
+    assert response.overall_health_score == 100 - (20 + 30 + 15)
+
+
+@pytest.mark.asyncio
+async def test_audit_fallback_lists_issues_arm_by_arm():
+    """Issues are ordered by arm, then by rule, as the per-arm checks run."""
+    request = ROIAuditRequest(arms=make_arms(), account_id="acct", optimization_goal="ltv")
+
+    response = await ROIAuditAgent()._audit_fallback(request)
+
+    assert [(i.issue_type, i.affected_arms[0]) for i in response.tracking_issues] == [
+        ("missing_conversions", "fb_1"),
+        ("low_conversion_volume", "g_1"),
+    ]
+    assert [(i.issue_type, i.description.split()[1]) for i in response.configuration_issues] == [
+        ("missing_ltv_data", "fb_1"),
+        ("negative_roas", "fb_2"),
+        ("missing_ltv_data", "fb_2"),
+        ("missing_ltv_data", "g_2"),
+        ("out_of_stock_campaign", "g_2"),
+    ]
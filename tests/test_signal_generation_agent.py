@@ -0,0 +1,97 @@
+"""Tests for signal generation agent."""
+from datetime import datetime
+
+import pytest
+
+from backend.agents.signal_generation_agent import (
+    BusinessEvent,
+    LTVData,
+    SignalGenerationAgent,
+    SignalGenerationRequest
+)
+
+
+@pytest.mark.asyncio
+async def test_fallback_uses_first_ltv_row_per_user():
+    """High-value classification uses the first LTV row for each user."""
+    events = [
+        BusinessEvent(event_type="purchase", event_id="p1", user_id="u1",
+                      timestamp=datetime(2024, 1, 1), revenue=100.0),
+        BusinessEvent(event_type="purchase", event_id="p2", user_id="u2",
+                      timestamp=datetime(2024, 1, 1), revenue=100.0),
+    ]
+    request = SignalGenerationRequest(
+        events=events,
+        platform="facebook",
+        ltv_data=[
+            LTVData(user_id="u1", predicted_ltv=400.0),
+            LTVData(user_id="u1", predicted_ltv=50.0),
+            LTVData(predicted_ltv=900.0),
+        ]
+    )
+    
+    response = await SignalGenerationAgent()._generate_signals_fallback(request)
+    
+    by_event = {signal.event_id: signal for signal in response.signals}
+    assert by_event["p1_facebook"].classification == "high_value_purchase"
+    assert by_event["p1_facebook"].value == 400.0
+    assert by_event["p2_facebook"].classification == "purchase"
+    assert response.total_value == 500.0
+    assert response.signals_by_platform == {"facebook": 2}
+
+
+@pytest.mark.asyncio
+async def test_fallback_classifies_each_event_type():
+    """Each event type maps to its classification, event name and value."""
+    timestamp = datetime(2024, 1, 1)
+    request = SignalGenerationRequest(
+        events=[
+            BusinessEvent(event_type="purchase", event_id="p", user_id="u",
+                          timestamp=timestamp),
+            BusinessEvent(event_type="lead", event_id="l", user_id="u",
+                          timestamp=timestamp, metadata={"qualified": True}),
+            BusinessEvent(event_type="signup", event_id="s", user_id="u",
+                          timestamp=timestamp),
+            BusinessEvent(event_type="add_to_cart", event_id="a", user_id="u",
+                          timestamp=timestamp, revenue=5.0),
+        ],
+        platform="google",
+        qualification_rules={"min_score": 70}
+    )
+    
+    response = await SignalGenerationAgent()._generate_signals_fallback(request)
+    
+    assert response.issues_detected == ["Purchase event p missing revenue"]
+    assert [
+        (signal.classification, signal.event_name, signal.value)
+        for signal in response.signals
+    ] == [
+        ("qualified_lead", "Lead", 10.0),
+        ("trial_start", "CompleteRegistration", 0.0),
+        ("add_to_cart", "add_to_cart", 5.0),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_fallback_rejects_negative_values_and_stringifies_user_data():
+    """Negative margin-derived values are reported, and identifiers become strings."""
+    events = [
+        BusinessEvent(event_type="purchase", event_id="p1", user_id="u1",
+                      timestamp=datetime(2024, 1, 1), revenue=100.0,
+                      metadata={"product_id": "p"}),
+        BusinessEvent(event_type="lead", event_id="l1", user_id="u2",
+                      timestamp=datetime(2024, 1, 1), metadata={"phone": 5551234}),
+    ]
+    request = SignalGenerationRequest(
+        events=events, platform="both", profit_margins={"p": -0.5}
+    )
+
+    response = await SignalGenerationAgent()._generate_signals_fallback(request)
+
+    assert [s.event_id for s in response.signals] == ["l1_facebook", "l1_google"]
+    assert all(s.value >= 0 for s in response.signals)
+    assert response.total_value == 20.0
+    assert any("p1" in issue for issue in response.issues_detected)
+    assert response.signals[0].user_data == {"phone": "5551234"}
+    assert response.signals[0].custom_data is not response.signals[1].custom_data
+    assert response.signals[0].custom_data is not events[1].metadata
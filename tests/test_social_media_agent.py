@@ -0,0 +1,32 @@
+"""Tests for social media agent."""
+from datetime import datetime
+
+import pytest
+from pydantic import ValidationError
+
+from backend.agents.social_media_agent import SocialAnalyticsRequest, SocialPostRequest
+
+
+def test_analytics_request_parses_iso_dates():
+    """ISO date strings are parsed into datetimes."""
+    request = SocialAnalyticsRequest(
+        platform="instagram", start_date="2024-01-01", end_date="2024-01-31T12:00:00"
+    )
+    
+    assert request.start_date == datetime(2024, 1, 1)
+    assert request.end_date == datetime(2024, 1, 31, 12)
+
+
+def test_analytics_request_rejects_reversed_range():
+    """A window that ends before it starts is invalid."""
+    with pytest.raises(ValidationError):
+        SocialAnalyticsRequest(platform="instagram", start_date="2024-02-01", end_date="2024-01-01")
+
+
+def test_post_request_parses_scheduled_time():
+    """Scheduled times are parsed into datetimes."""
+    request = SocialPostRequest(
+        platform="x", content="hi", scheduled_time="2024-03-01T09:30:00"
+    )
+    
+    assert request.scheduled_time == datetime(2024, 3, 1, 9, 30)
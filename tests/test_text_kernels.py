@@ -0,0 +1,18 @@
+"""Tests for text measurement kernels."""
+import pytest
+
+from backend.agents._text_kernels import count_words, flesch_reading_ease, text_buffer
+
+
+def test_count_words():
+    """Words are split on any whitespace run."""
+    assert count_words(text_buffer("Hello  world.\nThis is\ta test ")) == 6
+    assert count_words(text_buffer("")) == 0
+
+
+def test_flesch_reading_ease():
+    """Score matches the Flesch formula with vowel-group syllables."""
+    # 4 words, 1 sentence, 5 syllables (the=1, cat=1, sat=1, quietly=2)
+    expected = 206.835 - 1.015 * 4 - 84.6 * (5 / 4)
+    assert flesch_reading_ease(text_buffer("The cat sat quietly.")) == pytest.approx(expected)
+    assert flesch_reading_ease(text_buffer("   ")) == 0.0